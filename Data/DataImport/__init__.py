@@ -1,3 +1,7 @@
 from . import storage
 from . import dataimport
 from . import featureset
+
+# Types loaded by name that are not subclasses of the storage interfaces
+storage.BasicInterface.register_type("Feature", featureset.Feature)
+storage.BasicInterface.register_type("FeatureSet", featureset.FeatureSet)
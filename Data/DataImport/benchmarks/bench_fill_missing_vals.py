@@ -0,0 +1,76 @@
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from DataImport.dataimport import HDFImport
+
+
+def fill_missing_vals_minute_grid(df: pd.DataFrame, freq="15T"):
+    """
+    Previous implementation of HDFImport.fill_missing_vals - reference for results and memory
+    """
+    df = df.reindex(pd.DatetimeIndex(pd.date_range(df.index[0], df.index[-1], freq='min')), fill_value=np.nan)
+    df = df.resample(freq).first()
+    df = df.where(df.isna() == False)
+    df = df.copy().groupby(df.index.time).ffill()
+    return df
+
+
+def create_data(num_days=365, num_cols=10, freq="15T", missing_ratio=0.05):
+    """
+    Create 15 minute data with missing samples and missing values
+    @return: df
+    """
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=num_days * 96, freq=freq)
+    df = pd.DataFrame(rng.random((index.shape[0], num_cols)), index=index, columns=[f"x{i}" for i in range(num_cols)])
+    df = df[rng.random(index.shape[0]) > missing_ratio]
+    return df.mask(rng.random(df.shape) < missing_ratio)
+
+
+def create_mixed_grid_data(num_rows=2000, num_cols=3):
+    """
+    Create 1 minute data switching to timestamps at :30 seconds - only values before the switch are on the minute grid
+    @return: df
+    """
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=num_rows // 2, freq="min")
+    index = index.append(pd.date_range(index[-1] + pd.Timedelta(seconds=90), periods=num_rows - index.shape[0], freq="min"))
+    return pd.DataFrame(rng.random((index.shape[0], num_cols)), index=index, columns=[f"x{i}" for i in range(num_cols)])
+
+
+def check_equivalence(data_import: HDFImport):
+    """
+    Compare results with previous implementation for data with timestamps off the minute grid
+    """
+    data = create_mixed_grid_data()
+    pd.testing.assert_frame_equal(fill_missing_vals_minute_grid(data, data_import.freq),
+                                  data_import.fill_missing_vals(data), check_freq=False)
+
+
+def measure(func, *args):
+    """
+    Measure wall time and peak memory of function call
+    @return: result, time in s, peak memory in MB
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak / 1e6
+
+
+if __name__ == "__main__":
+    num_days = int(sys.argv[1]) if len(sys.argv) > 1 else 3 * 365
+    data = create_data(num_days)
+    data_import = HDFImport(freq="15T")
+    check_equivalence(data_import)
+    df_ref, time_ref, peak_ref = measure(fill_missing_vals_minute_grid, data, "15T")
+    df_new, time_new, peak_new = measure(data_import.fill_missing_vals, data)
+    pd.testing.assert_frame_equal(df_ref, df_new, check_freq=False)
+    print(f"Data: {num_days} days, {data.shape[0]} rows, {data.memory_usage().sum() / 1e6:.1f} MB")
+    print(f"Minute grid:   {time_ref:.3f} s, peak {peak_ref:.1f} MB")
+    print(f"Target freq:   {time_new:.3f} s, peak {peak_new:.1f} MB")
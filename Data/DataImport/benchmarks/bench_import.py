@@ -0,0 +1,155 @@
+"""
+Benchmark of DataImport backends.
+Synthetic datasets shaped like SingleCollectorTest (index t in days, 15 minute samples) are stored with data_to_file
+and imported with import_data. Each step runs in a new process, so peak RSS is measured per step.
+Usage: python -m DataImport.benchmarks.bench_import --rows 1e5 1e6 --width 5 --output results.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from DataImport.dataimport import CSVImport, TXTImport, TXTImport_Octave, HDFImport, ExcelImport, NpyMemmapImport, \
+    ImportReport
+from DataImport.dataimport.instrumentation import get_peak_rss
+
+COLUMNS = ["TSolarSeg", "TSolarReturn", "TAmbient", "Radiation_Hor", "dmSolar"]
+# Excel sheets are limited to 1048576 rows
+MAX_ROWS = {"ExcelImport": 1048575}
+# Optional backends are imported before measuring
+BACKENDS = ["tables", "openpyxl", "pyarrow"]
+
+
+def create_importers():
+    """
+    Create importers with SingleCollectorTest configuration
+    @return: list of importers
+    """
+    args = dict(freq="15T", index_col="t", index_type="float", fill_values=False)
+    importers = [CSVImport(**args), TXTImport(**args), TXTImport_Octave(**args), HDFImport(**args),
+                 ExcelImport(**args), NpyMemmapImport(**args)]
+    # unit is not a constructor argument
+    for data_import in importers:
+        data_import.unit = "d"
+    return importers
+
+
+def create_data(num_rows=100000, width=5, seed=0):
+    """
+    Create synthetic data - columns of SingleCollectorTest, additional columns x<i> for width > 5
+    @param num_rows: number of rows
+    @param width: number of columns
+    @return: df - index t in days
+    """
+    rng = np.random.default_rng(seed)
+    columns = COLUMNS[:width] + [f"x{i}" for i in range(width - len(COLUMNS))]
+    index = pd.Index(np.arange(num_rows) / 96, name="t")
+    return pd.DataFrame(rng.normal(20, 5, (num_rows, width)), index=index, columns=columns)
+
+
+def write_file(data_import, filename, num_rows, width):
+    """
+    Create data and store it using data_to_file
+    @return: dict of measurements
+    """
+    df = create_data(num_rows, width)
+    rss_start = get_peak_rss()
+    start = time.perf_counter()
+    data_import.data_to_file(df, filename)
+    duration = time.perf_counter() - start
+    return {"write_time": duration, "write_rss_delta": _delta(get_peak_rss(), rss_start),
+            "file_size": sum(os.path.getsize(path) for path in data_import.get_source_files(filename))}
+
+
+def read_file(data_import, filename, trace_memory=False):
+    """
+    Import data using import_data
+    @return: dict of measurements
+    """
+    report = ImportReport(trace_memory=trace_memory)
+    rss_start = get_peak_rss()
+    df = data_import.import_data(filename, report=report)
+    return {"read_time": report.wall_time, "read_rss_delta": _delta(get_peak_rss(), rss_start),
+            "rows_read": int(df.shape[0]), "stages": report.to_dict()["stages"]}
+
+
+def run_case(data_import, num_rows, width, dir, trace_memory=False):
+    """
+    Run benchmark for one importer and size - write and read run in separate processes
+    @return: dict of results
+    """
+    name = data_import.__class__.__name__
+    result = {"importer": name, "rows": num_rows, "width": width}
+    if num_rows > MAX_ROWS.get(name, num_rows):
+        return dict(result, skipped=f"more than {MAX_ROWS[name]} rows")
+    filename = os.path.join(dir, f"{name}_{num_rows}_{width}")
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=import_backends) as executor:
+            result.update(executor.submit(write_file, data_import, filename, num_rows, width).result())
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=import_backends) as executor:
+            result.update(executor.submit(read_file, data_import, filename, trace_memory).result())
+    except Exception as ex:
+        return dict(result, error=repr(ex))
+    finally:
+        for path in data_import.get_source_files(filename) if os.path.exists(dir) else []:
+            if os.path.exists(path):
+                os.remove(path)
+    result["read_rows_per_s"] = num_rows / result["read_time"]
+    result["write_rows_per_s"] = num_rows / result["write_time"]
+    result["read_mb_per_s"] = result["file_size"] / result["read_time"] / 1e6
+    return result
+
+
+def import_backends():
+    """
+    Import optional backends - module import time is not measured
+    """
+    for module in BACKENDS:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _delta(val, start):
+    """
+    Difference of measurements - None if not supported
+    """
+    return None if val is None or start is None else val - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DataImport backends")
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e5, 1e6, 1e7, 1e8])
+    parser.add_argument("--width", type=int, default=len(COLUMNS))
+    parser.add_argument("--importers", nargs="+", default=None, help="class names - default: all")
+    parser.add_argument("--dir", default=None, help="directory for data files - default: temporary directory")
+    parser.add_argument("--trace-memory", action="store_true", help="record tracemalloc peak of import stages")
+    parser.add_argument("--output", default=None, help="json file - default: stdout")
+    args = parser.parse_args(argv)
+
+    importers = [imp for imp in create_importers() if args.importers is None or imp.__class__.__name__ in args.importers]
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as dir:
+        for num_rows in map(int, args.rows):
+            for data_import in importers:
+                result = run_case(data_import, num_rows, args.width, dir, args.trace_memory)
+                print(json.dumps({key: val for key, val in result.items() if key != "stages"}), file=sys.stderr)
+                results.append(result)
+    output = {"python": sys.version.split()[0], "pandas": pd.__version__, "numpy": np.__version__, "results": results}
+    if args.output is None:
+        print(json.dumps(output, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of PickleInterface storage formats: save time, load time, time to first use of the weights and file size.
+Usage: python -m DataImport.benchmarks.bench_pickle --size-mb 200 --output results.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib.util
+import numpy as np
+from DataImport.storage import PickleInterface
+
+# Storage variants: name, save_pkl arguments
+VARIANTS = [("default", {}),
+            ("out_of_band", {"out_of_band": True}),
+            ("out_of_band_zlib", {"out_of_band": True, "codec": "zlib"}),
+            ("out_of_band_lzma", {"out_of_band": True, "codec": "lzma"}),
+            ("out_of_band_lz4", {"out_of_band": True, "codec": "lz4"}),
+            ("out_of_band_zstd", {"out_of_band": True, "codec": "zstd"})]
+# Optional codec packages
+CODEC_MODULES = {"lz4": "lz4", "zstd": "zstandard"}
+
+
+class WeightsModel(PickleInterface):
+    """
+    Model artifact with weight arrays and some metadata
+    """
+    def __init__(self, weights=None, metadata=None):
+        self.weights = weights
+        self.metadata = metadata
+
+
+def create_model(size_mb=100, num_arrays=20, seed=0):
+    """
+    Create model with float32 weights - quantized values, so compression has an effect
+    @param size_mb: total size of weights
+    @param num_arrays: number of weight arrays
+    @return: WeightsModel
+    """
+    rng = np.random.default_rng(seed)
+    num_values = int(size_mb * 1e6 / 4 / num_arrays)
+    weights = [np.round(rng.normal(0, 1, num_values), 2).astype(np.float32) for _ in range(num_arrays)]
+    return WeightsModel(weights, {"layers": num_arrays, "names": [f"layer{i}" for i in range(num_arrays)]})
+
+
+def run_variant(model, dir, name, args):
+    """
+    Save and load model
+    @return: dict of measurements
+    """
+    codec = args.get("codec")
+    if codec in CODEC_MODULES and importlib.util.find_spec(CODEC_MODULES[codec]) is None:
+        return {"variant": name, "skipped": f"{CODEC_MODULES[codec]} not installed"}
+    filename = f"{name}.pkl"
+    start = time.perf_counter()
+    model.save_pkl(dir, filename, **args)
+    save_time = time.perf_counter() - start
+    start = time.perf_counter()
+    loaded = WeightsModel.load_pkl(dir, filename)
+    load_time = time.perf_counter() - start
+    start = time.perf_counter()
+    checksum = float(sum(weights.sum(dtype=np.float64) for weights in loaded.weights))
+    use_time = time.perf_counter() - start
+    file_size = sum(os.path.getsize(os.path.join(dir, file)) for file in [filename, f"{filename}.buffers"]
+                    if os.path.exists(os.path.join(dir, file)))
+    return {"variant": name, "save_time": save_time, "load_time": load_time, "first_use_time": use_time,
+            "file_size": file_size, "checksum": checksum}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PickleInterface storage formats")
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--num-arrays", type=int, default=20)
+    parser.add_argument("--output", default=None, help="json file - default: stdout")
+    args = parser.parse_args(argv)
+
+    model = create_model(args.size_mb, args.num_arrays)
+    with tempfile.TemporaryDirectory() as dir:
+        results = [run_variant(model, dir, name, variant_args) for name, variant_args in VARIANTS]
+    output = {"python": sys.version.split()[0], "numpy": np.__version__, "size_mb": args.size_mb, "results": results}
+    if args.output is None:
+        print(json.dumps(output, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
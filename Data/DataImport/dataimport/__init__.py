@@ -3,4 +3,6 @@ from .csvimport import CSVImport
 from .hdfimport import HDFImport
 from .excelimport import ExcelImport
 from .txtimport import TXTImport
-from .txtimport_octave import TXTImport_Octave
\ No newline at end of file
+from .txtimport_octave import TXTImport_Octave
+from .npyimport import NpyMemmapImport
+from .instrumentation import ImportReport, StageReport
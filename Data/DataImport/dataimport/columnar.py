@@ -0,0 +1,215 @@
+"""
+Columnar storage of dataframes.
+Files:
+- <path>.npy: column-major (Fortran order) 2D array of values - every column is contiguous
+- <path>.index.npy: index values
+- <path>.json: sidecar - column names, index name
+Alternatively, values and index are stored in one archive <path>.npz (not memory-mapped).
+Dataframes with mixed or non-numeric dtypes are stored as pickle (<path>.pkl).
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+
+def is_columnar(df: pd.DataFrame):
+    """
+    Check if dataframe can be stored in columnar format - requires one numeric dtype for all columns
+    @param df: dataframe
+    @return: True if supported
+    """
+    dtypes = set(df.dtypes)
+    if len(dtypes) > 1 or not isinstance(df.index.dtype, np.dtype) or df.index.dtype.kind == "O":
+        return False
+    return len(dtypes) == 0 or (isinstance(df.dtypes.iloc[0], np.dtype) and df.dtypes.iloc[0].kind in "biuf")
+
+
+def write_columnar(df: pd.DataFrame, path="", archive=False):
+    """
+    Store dataframe in columnar format - falls back to pickle for unsupported dtypes
+    @param df: dataframe
+    @param path: path without extension
+    @param archive: store values and index in npz archive
+    """
+    remove_columnar(path)
+    if not is_columnar(df):
+        df.to_pickle(f"{path}.pkl")
+        return
+    if archive:
+        np.savez(f"{path}.npz", values=np.asfortranarray(df.to_numpy()), index=df.index.to_numpy())
+    else:
+        np.save(f"{path}.npy", np.asfortranarray(df.to_numpy()))
+        np.save(f"{path}.index.npy", df.index.to_numpy())
+    with open(f"{path}.json", "w") as f:
+        json.dump({"columns": df.columns.tolist(), "index_name": df.index.name}, f)
+
+
+def read_columnar(path="", mmap_mode="r"):
+    """
+    Load dataframe from columnar format - values are memory-mapped
+    @param path: path without extension
+    @param mmap_mode: mode for np.load - 'r': read only, 'c': copy on write, None: read to memory
+    @return: df
+    """
+    if os.path.exists(f"{path}.pkl"):
+        return pd.read_pickle(f"{path}.pkl")
+    with open(f"{path}.json", "r") as f:
+        sidecar = json.load(f)
+    if os.path.exists(f"{path}.npz"):
+        with np.load(f"{path}.npz") as archive:
+            values, index = archive["values"], archive["index"]
+    else:
+        values = np.load(f"{path}.npy", mmap_mode=mmap_mode)
+        index = np.load(f"{path}.index.npy", mmap_mode=mmap_mode)
+    index = pd.Index(index, name=sidecar["index_name"])
+    return pd.DataFrame(values, index=index, columns=sidecar["columns"], copy=False)
+
+
+def columnar_exists(path=""):
+    """
+    Check if dataframe is stored at path
+    @param path: path without extension
+    @return: True if file exists
+    """
+    return os.path.exists(f"{path}.pkl") or os.path.exists(f"{path}.json")
+
+
+def remove_columnar(path=""):
+    """
+    Remove stored dataframe files
+    @param path: path without extension
+    """
+    for extension in ["pkl", "npy", "npz", "index.npy", "json"]:
+        if os.path.exists(f"{path}.{extension}"):
+            os.remove(f"{path}.{extension}")
+
+
+class FrameBuffer:
+    """
+    Growable row storage for a dataframe - appending rows costs O(new rows) (amortized).
+    Dataframes with one numeric dtype are stored in a preallocated array, the capacity is doubled when full.
+    Frames returned by to_frame are views of the array. Other dataframes are kept as list of chunks,
+    which are concatenated on access.
+    Pending rows are stored after the appended rows - they are replaced by the next call of append or set_pending.
+    """
+    values: np.ndarray = None
+    index: np.ndarray = None
+    columns: list = None
+    index_name: str = None
+    num_rows: int = 0
+    num_pending: int = 0
+
+    def __init__(self):
+        self.values = None
+        self.index = None
+        self.columns = None
+        self.index_name = None
+        self.num_rows = 0
+        self.num_pending = 0
+        self.chunks = []
+        self.pending = None
+
+    def append(self, df: pd.DataFrame):
+        """
+        Append rows - pending rows are removed
+        @param df: rows to append
+        """
+        self.set_pending(None)
+        if self.values is None and not self.chunks and is_columnar(df):
+            self._allocate(df, df.shape[0])
+        if self._fits(df):
+            self._write(df, self.num_rows)
+            self.num_rows += df.shape[0]
+            return
+        if self.values is not None:
+            self.chunks = [self.to_frame()]
+            self.values, self.index, self.num_rows = None, None, 0
+        self.chunks.append(df)
+
+    def set_pending(self, df: pd.DataFrame = None):
+        """
+        Set pending rows - replaces previous pending rows
+        @param df: rows or None
+        """
+        self.pending, self.num_pending = None, 0
+        if df is None or df.empty:
+            return
+        if self._fits(df):
+            self._write(df, self.num_rows)
+            self.num_pending = df.shape[0]
+        else:
+            self.pending = df
+
+    def last_index(self):
+        """
+        Get last index value of appended rows
+        @return: index value - None if empty
+        """
+        if self.values is not None:
+            return self.index[self.num_rows - 1] if self.num_rows > 0 else None
+        last = [chunk.index[-1] for chunk in self.chunks if not chunk.empty]
+        return last[-1] if last else None
+
+    def to_frame(self, pending=True):
+        """
+        Get dataframe of stored rows
+        @param pending: include pending rows
+        @return: df - None if no rows were appended
+        """
+        if self.values is None and len(self.chunks) > 1:
+            df = pd.concat(self.chunks)
+            self.chunks = []
+            self.append(df)
+        if self.values is not None:
+            num_rows = self.num_rows + (self.num_pending if pending else 0)
+            index = pd.Index(self.index[:num_rows], name=self.index_name, copy=False)
+            df = pd.DataFrame(self.values[:num_rows], index=index, columns=self.columns, copy=False)
+        elif self.chunks:
+            df = self.chunks[0]
+        else:
+            return None
+        if pending and self.pending is not None:
+            return pd.concat([df, self.pending])
+        return df
+
+    def _allocate(self, df: pd.DataFrame, capacity: int):
+        """
+        Allocate storage for rows of df
+        @param df: dataframe with one numeric dtype
+        @param capacity: number of rows
+        """
+        dtype = df.dtypes.iloc[0] if df.shape[1] > 0 else np.dtype("float64")
+        self.values = np.empty((max(capacity, 1), df.shape[1]), dtype=dtype)
+        self.index = np.empty(max(capacity, 1), dtype=df.index.dtype)
+        self.columns = df.columns.tolist()
+        self.index_name = df.index.name
+
+    def _fits(self, df: pd.DataFrame):
+        """
+        Check if rows can be stored in array - same columns and index dtype, values can be cast safely
+        @param df: dataframe
+        @return: True if rows can be stored
+        """
+        if self.values is None or df.columns.tolist() != self.columns or not is_columnar(df):
+            return False
+        if df.index.dtype != self.index.dtype or df.index.name != self.index_name:
+            return False
+        return df.shape[1] == 0 or np.can_cast(df.dtypes.iloc[0], self.values.dtype, "safe")
+
+    def _write(self, df: pd.DataFrame, position: int):
+        """
+        Write rows to array at position - capacity is doubled if necessary
+        @param df: rows
+        @param position: first row
+        """
+        end = position + df.shape[0]
+        if end > self.values.shape[0]:
+            capacity = max(end, 2 * self.values.shape[0])
+            values = np.empty((capacity, self.values.shape[1]), dtype=self.values.dtype)
+            index = np.empty(capacity, dtype=self.index.dtype)
+            values[:position] = self.values[:position]
+            index[:position] = self.index[:position]
+            self.values, self.index = values, index
+        self.values[position:end] = df.to_numpy(dtype=self.values.dtype)
+        self.index[position:end] = df.index.to_numpy()
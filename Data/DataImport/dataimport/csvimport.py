@@ -1,6 +1,7 @@
 import pandas as pd
 
 from . import DataImport
+from . import text_window
 
 
 class CSVImport(DataImport):
@@ -14,12 +15,40 @@ class CSVImport(DataImport):
         super().__init__(**kwargs)
         self.sep = sep
 
-    def read_file(self, filename="", **kwargs):
+    def read_file(self, filename="", usecols=None, start=None, stop=None, **kwargs):
         """
          Get dataframe from file
+         @param usecols: columns to read - None: all columns
+         @param start: first index value - file must be sorted
+         @param stop: last index value - file must be sorted
          @return: df
          """
-        return pd.read_csv(self.add_extension(filename, "csv"), sep=self.sep)
+        source = self.get_text_source(self.add_extension(filename, "csv"), self.sep, start=start, stop=stop)
+        index_col = self.get_reader_index_col(self.get_header(source, self.sep))
+        return pd.read_csv(source, sep=self.sep, usecols=self.usecols_filter(usecols), index_col=index_col)
+
+    def read_chunks(self, filename="", chunksize=100000, usecols=None, **kwargs):
+        """
+        Get dataframe chunks from file
+        @param usecols: columns to read - None: all columns
+        @return: generator of df
+        """
+        with pd.read_csv(self.add_extension(filename, "csv"), sep=self.sep, chunksize=chunksize,
+                         usecols=self.usecols_filter(usecols)) as reader:
+            yield from reader
+
+    def read_new_rows(self, filename="", position=0, usecols=None, **kwargs):
+        """
+        Get rows added to file after position
+        @param position: byte offset returned by previous call - 0: start of file
+        @param usecols: columns to read - None: all columns
+        @return: df of new rows (None if no new rows), new position
+        """
+        source, position = text_window.read_from_offset(self.add_extension(filename, "csv"), position)
+        if source is None:
+            return None, position
+        index_col = self.get_reader_index_col(self.get_header(source, self.sep))
+        return pd.read_csv(source, sep=self.sep, usecols=self.usecols_filter(usecols), index_col=index_col), position
 
     def data_to_file(self, df: pd.DataFrame, filename=""):
         """
@@ -1,9 +1,20 @@
 import os
+import re
+import json
+import pickle
+import hashlib
+import datetime as dt
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from typing import List
+from pandas.tseries.frequencies import to_offset
 from ..storage import JSONInterface
-import datetime as dt
+from . import columnar
+from . import text_window
+from .instrumentation import ImportReport, run_stage
+from dateutil.tz import tzlocal
 
 
 class DataImport(JSONInterface):
@@ -11,15 +22,34 @@ class DataImport(JSONInterface):
     Data import - abstract base class.
     Main method:
     - import_data
+    - iter_import
+    - import_many
+    - import_incremental
+    Cache:
+    - if cache_dir is set, processed data is stored in columnar format and loaded from there
+      as long as the source files and the configuration are unchanged
     Load files:
     - read file - override this!
+    - read chunks
+    - read new rows
+    Time window:
+    - start, stop: only rows with index in [start, stop] are imported.
+      Sorted text files are searched for the window, HDF table stores are queried.
+    Column projection:
+    - columns (after renaming) or inputs and outputs of a feature set are mapped to the names in the file
+      and passed to the readers as usecols
     Dataframe operations:
     - set index
     - fill missing values
     - df_info
     - rename columns
     - drop columns
+    - set dtypes
     - to csv
+    Dtypes:
+    - float columns are stored as float_dtype (e.g. float32)
+    - compact_ints: integer columns are downcast to the smallest integer type
+    - features of a feature set are converted to their declared type (Real, Int, Bool)
     """
     unit: str = "s"
     freq: str = "1H"
@@ -29,10 +59,15 @@ class DataImport(JSONInterface):
     cols_to_rename: dict = {}
     cols_to_drop: List[str] = []
     fill_values = False
+    cache_dir: str = None
+    float_dtype: str = "float64"
+    compact_ints: bool = False
+    file_extension: str = "csv"
+    _incremental_state: dict = None
 
     def __init__(self, freq='15T', index_col="daytime", index_type="datetime",
                  datetime_fmt="infer", cols_to_rename={}, cols_to_drop=[],
-                 fill_values=False, **kwargs):
+                 fill_values=False, cache_dir=None, float_dtype="float64", compact_ints=False, **kwargs):
         super(DataImport, self).__init__(**kwargs)
         self.freq = freq
         self.index_col = index_col
@@ -41,47 +76,559 @@ class DataImport(JSONInterface):
         self.fill_values = fill_values
         self.index_type = index_type
         self.datetime_fmt = datetime_fmt
+        self.cache_dir = cache_dir
+        self.float_dtype = float_dtype
+        self.compact_ints = compact_ints
 
-    def import_data(self, filename="", **kwargs):
+    def import_data(self, filename="", feature_set=None, columns: List[str] = None, start=None, stop=None,
+                    report: ImportReport = None, **kwargs):
         """
         Import data.
+        @param filename: path to file
+        @param feature_set: FeatureSet (optional) - declared feature types are applied,
+        only inputs and outputs are read if columns is None
+        @param columns: columns to import (names after renaming) - None: all columns
+        @param start: first index value to import - datetime: timestamp, else timedelta or number in unit
+        @param stop: last index value to import
+        @param report: ImportReport (optional) - wall time, rows and memory of each stage are recorded
         @return: pd.Dataframe
         """
-        df = self.read_file(filename, **kwargs)
-        df = self.set_index(df)
+        feature_types = self.get_feature_types(feature_set)
+        usecols = self.get_usecols(columns, feature_set)
+        if usecols is not None:
+            kwargs['usecols'] = usecols
+        if start is not None or stop is not None:
+            kwargs.update(start=self.index_value(start), stop=self.index_value(stop))
+        if self.cache_dir is not None:
+            return self._import_cached(filename, feature_types, report, **kwargs)
+        df = run_stage(report, "read_file", self.read_file, None, filename, **kwargs)
+        df = run_stage(report, "select_columns", self.select_columns, df, usecols)
+        return self.process_data(df, feature_types=feature_types, start=kwargs.get('start'), stop=kwargs.get('stop'),
+                                 report=report)
+
+    def iter_import(self, filename="", chunksize=100000, feature_set=None, columns: List[str] = None, start=None,
+                    stop=None, **kwargs):
+        """
+        Import data in chunks - generator.
+        Applies the same operations as import_data to each chunk.
+        Resampling state is carried across chunk boundaries.
+        @param filename: path to file
+        @param chunksize: number of rows per chunk
+        @param feature_set: FeatureSet (optional) - declared feature types are applied,
+        only inputs and outputs are read if columns is None
+        @param columns: columns to import (names after renaming) - None: all columns
+        @param start: first index value to import - the window is selected from each chunk after parsing,
+        the whole file is read
+        @param stop: last index value to import
+        @return: generator of pd.Dataframe
+        """
+        feature_types = self.get_feature_types(feature_set)
+        usecols = self.get_usecols(columns, feature_set)
+        if usecols is not None:
+            kwargs['usecols'] = usecols
+        start, stop = self.index_value(start), self.index_value(stop)
+        state = {}
+        chunks = self.read_chunks(filename, chunksize, **kwargs)
+        chunk = next(chunks, None)
+        while chunk is not None:
+            next_chunk = next(chunks, None)
+            state['final'] = next_chunk is None
+            df = self.process_data(self.select_columns(chunk, usecols), state, feature_types, start, stop)
+            if not df.empty:
+                yield df
+            chunk = next_chunk
+
+    def import_many(self, filenames: List[str], workers=1, feature_set=None, columns: List[str] = None, start=None,
+                    stop=None, **kwargs):
+        """
+        Import multiple files and merge them.
+        Files are read in parallel processes - each worker reads the file, sets the index and selects the window.
+        The rows are merged into one sorted index. For duplicate index values, the last file in filenames is kept.
+        Missing values are filled after merging, so the result does not depend on how the data is split into files.
+        @param filenames: paths to files
+        @param workers: number of processes - None: number of CPUs
+        @param feature_set: FeatureSet (optional) - declared feature types are applied,
+        only inputs and outputs are read if columns is None
+        @param columns: columns to import (names after renaming) - None: all columns
+        @param start: first index value to import - as for import_data, readers skip rows outside the window
+        where supported
+        @param stop: last index value to import
+        @return: pd.Dataframe
+        """
+        usecols = self.get_usecols(columns, feature_set)
+        if usecols is not None:
+            kwargs['usecols'] = usecols
+        if start is not None or stop is not None:
+            kwargs.update(start=self.index_value(start), stop=self.index_value(stop))
+        read = partial(self._read_indexed, **kwargs)
+        workers = os.cpu_count() if workers is None else workers
+        if workers > 1 and len(filenames) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(filenames))) as executor:
+                list_dfs = list(executor.map(read, filenames))
+        else:
+            list_dfs = [read(filename) for filename in filenames]
+        df = pd.concat(list_dfs)
+        del list_dfs
+        df = df.sort_index(kind="mergesort")
+        df = df[~df.index.duplicated(keep="last")]
         if self.fill_values:
             df = self.fill_missing_vals(df)
         df = self.rename_columns(df)
         df = self.drop_columns(df)
+        return self.set_dtypes(df, self.get_feature_types(feature_set))
+
+    def import_incremental(self, filename="", feature_set=None, columns: List[str] = None, **kwargs):
+        """
+        Import rows added to the file since the last call and merge them with the data imported before.
+        New rows are appended to a growable buffer, so the cost of a call depends on the number of new rows.
+        The returned frame is a view of the buffer - rows of the last resampling interval, which may be continued
+        by new rows, are replaced by the next call. Copy the frame before modifying it.
+        The file position, resampling state and imported rows are kept in memory and, if cache_dir is set,
+        stored in <cache_dir>/<filename>_incremental.
+        The file is imported completely on the first call or if it was replaced (different inode, smaller size
+        or older modification time).
+        @param filename: path to file
+        @param feature_set: FeatureSet (optional) - declared feature types are applied,
+        only inputs and outputs are read if columns is None
+        @param columns: columns to import (names after renaming) - None: all columns
+        @return: pd.Dataframe - all imported data
+        """
+        usecols = self.get_usecols(columns, feature_set)
+        feature_types = self.get_feature_types(feature_set)
+        stat = os.stat(self.get_source_files(filename)[0])
+        key = self.config_key(filename=os.path.abspath(filename), usecols=usecols, feature_types=feature_types, **kwargs)
+        state = self._incremental_state
+        if state is None or state['key'] != key:
+            state = self._load_incremental_state(filename, key)
+        if state is None or self._is_replaced(stat, state):
+            state = {'key': key, 'position': 0, 'fill_state': {'final': False}, 'buffer': columnar.FrameBuffer(),
+                     'df': None, 'rows_size': 0}
+        self._incremental_state = state
+        df, state['position'] = self.read_new_rows(filename, state['position'], usecols=usecols, **kwargs)
+        state.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, file_id=(stat.st_dev, stat.st_ino))
+        rewrite = False
+        if df is not None:
+            df = self.process_data(self.select_columns(df, usecols), state['fill_state'], feature_types)
+            rewrite = self._append_new_rows(state['buffer'], df)
+            state['df'] = None
+        if state['df'] is None:
+            state['buffer'].set_pending(self._get_pending_rows(state['fill_state'], feature_types))
+            state['df'] = state['buffer'].to_frame()
+        self._save_incremental_state(filename, state, df, rewrite)
+        return state['df']
+
+    def _append_new_rows(self, buffer: columnar.FrameBuffer, df: pd.DataFrame):
+        """
+        Append new rows to buffer - rows overlapping the stored rows are merged (buffer is rebuilt)
+        @param buffer: buffer of imported rows
+        @param df: new rows
+        @return: True if buffer was rebuilt
+        """
+        last_index = buffer.last_index()
+        if df.empty or last_index is None or last_index < df.index[0]:
+            buffer.append(df)
+            return False
+        merged = self._merge_new_rows(buffer.to_frame(pending=False), df)
+        buffer.__init__()
+        buffer.append(merged)
+        return True
+
+    def _get_pending_rows(self, fill_state: dict, feature_types: dict = None):
+        """
+        Get rows of the last resampling interval, which fill_missing_vals holds back (state key tail)
+        @param fill_state: resampling state - not modified
+        @param feature_types: dict feature name: declared type
+        @return: df - None if no rows are held back
+        """
+        if fill_state.get('tail') is None:
+            return None
+        fill_state = dict(fill_state, final=True)
+        df = self.fill_missing_vals(fill_state['tail'].iloc[:0], fill_state)
+        return self.set_dtypes(self.drop_columns(self.rename_columns(df)), feature_types)
+
+    @staticmethod
+    def _is_replaced(stat: os.stat_result, state: dict):
+        """
+        Check if file was replaced since last incremental import
+        @param stat: current stat of file
+        @param state: incremental import state
+        @return: True if file was replaced
+        """
+        if state.get('file_id') is None:
+            return False
+        return (state['file_id'] != (stat.st_dev, stat.st_ino) or stat.st_size < state['size']
+                or stat.st_mtime_ns < state['mtime_ns'])
+
+    def _get_incremental_dir(self, filename=""):
+        """
+        Get directory of stored incremental import state
+        @param filename: path to file
+        @return: path - None if cache_dir is not set
+        """
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{self.get_cache_name(filename)}_incremental")
+
+    def _load_incremental_state(self, filename="", key=""):
+        """
+        Load stored incremental import state
+        @param filename: path to file
+        @param key: configuration key - the state is only loaded if it was stored with the same key
+        @return: state - None if there is no matching stored state
+        """
+        path = self._get_incremental_dir(filename)
+        if path is None or not os.path.exists(os.path.join(path, "state.pkl")):
+            return None
+        with open(os.path.join(path, "state.pkl"), "rb") as f:
+            state = pickle.load(f)
+        if state['key'] != key:
+            return None
+        state.update(buffer=columnar.FrameBuffer(), df=None)
+        with open(os.path.join(path, "rows.pkl"), "rb") as f:
+            while f.tell() < state['rows_size']:
+                state['buffer'].append(pickle.load(f))
+        return state
+
+    def _save_incremental_state(self, filename="", state: dict = None, df: pd.DataFrame = None, rewrite=False):
+        """
+        Store incremental import state - new rows are appended to rows.pkl, the state is replaced.
+        rows.pkl is read up to the size stored in the state, so an interrupted update keeps the previous state.
+        @param filename: path to file
+        @param state: incremental import state
+        @param df: new rows - None: no new rows
+        @param rewrite: store all rows instead of appending new rows
+        """
+        path = self._get_incremental_dir(filename)
+        if path is None:
+            return
+        os.makedirs(path, exist_ok=True)
+        if rewrite or state['rows_size'] == 0 or df is not None:
+            with open(os.path.join(path, "rows.pkl"), "wb" if rewrite or state['rows_size'] == 0 else "r+b") as f:
+                if rewrite:
+                    df = state['buffer'].to_frame(pending=False)
+                else:
+                    f.seek(state['rows_size'])
+                if df is not None:
+                    pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.truncate()
+                state['rows_size'] = f.tell()
+        with open(os.path.join(path, "state.pkl.tmp"), "wb") as f:
+            pickle.dump({name: val for name, val in state.items() if name not in ['buffer', 'df']}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(os.path.join(path, "state.pkl.tmp"), os.path.join(path, "state.pkl"))
+
+    @staticmethod
+    def _merge_new_rows(df: pd.DataFrame, df_new: pd.DataFrame):
+        """
+        Append new rows - for overlapping index values, new rows are kept
+        @param df: dataframe
+        @param df_new: new rows
+        @return: merged df
+        """
+        if df_new.empty:
+            return df
+        if df.empty or df.index[-1] < df_new.index[0]:
+            return pd.concat([df, df_new])
+        df = pd.concat([df, df_new]).sort_index(kind="mergesort")
+        return df[~df.index.duplicated(keep="last")]
+
+    def _read_indexed(self, filename="", **kwargs):
+        """
+        Read file, set index and select window - used by import_many workers
+        @param filename: path to file
+        @return: pd.Dataframe
+        """
+        df = self.select_columns(self.read_file(filename, **kwargs), kwargs.get('usecols'))
+        return self.select_window(self.set_index(df), kwargs.get('start'), kwargs.get('stop'))
+
+    def process_data(self, df: pd.DataFrame, state: dict = None, feature_types: dict = None, start=None, stop=None,
+                     report: ImportReport = None):
+        """
+        Apply dataframe operations: set index, select window, fill missing values, rename and drop columns, set dtypes
+        @param df: dataframe to modify
+        @param state: resampling state - only used for chunked import
+        @param feature_types: dict feature name: declared type
+        @param start: first index value
+        @param stop: last index value
+        @param report: ImportReport (optional) - stages are recorded
+        @return: modified df
+        """
+        df = run_stage(report, "set_index", self.set_index, df)
+        df = run_stage(report, "select_window", self.select_window, df, start, stop)
+        if self.fill_values:
+            df = run_stage(report, "fill_missing_vals", self.fill_missing_vals, df, state)
+        df = run_stage(report, "rename_columns", self.rename_columns, df)
+        df = run_stage(report, "drop_columns", self.drop_columns, df)
+        df = run_stage(report, "set_dtypes", self.set_dtypes, df, feature_types)
         return df
 
     def to_datetime(self, vals):
         """
         Convert input values to datetime
+        Supported datetime_fmt:
+        - posix, posix_s, posix_ms, posix_us, posix_ns: epoch timestamps (unit), converted to local time
+        - explicit format, e.g. '%d.%m.%Y %H:%M'
+        - infer
         :param vals: values to convert
         :return: datetime vals
         """
-        if self.datetime_fmt == 'posix':
-            datetime = pd.to_datetime([dt.datetime.fromtimestamp(val) for val in vals])
-        else:
-            datetime = pd.to_datetime(vals, dayfirst=True, infer_datetime_format=True)
-        return datetime
+        vals = np.asarray(vals)
+        if self.datetime_fmt.startswith('posix'):
+            unit = self.datetime_fmt.split('_')[-1] if '_' in self.datetime_fmt else 's'
+            datetime = pd.to_datetime(vals, unit=unit, utc=True)
+            return datetime.tz_convert(tzlocal()).tz_localize(None)
+        # Convert each distinct value only once
+        codes, uniques = pd.factorize(vals)
+        if uniques.shape[0] == codes.shape[0]:
+            return self._parse_datetime(vals)
+        return self._parse_datetime(uniques).take(codes, fill_value=pd.NaT)
+
+    def _parse_datetime(self, vals):
+        """
+        Parse datetime - use explicit format if declared
+        :param vals: values to convert
+        :return: datetime vals
+        """
+        if '%' in self.datetime_fmt:
+            return pd.to_datetime(vals, format=self.datetime_fmt)
+        return pd.to_datetime(vals, dayfirst=True, infer_datetime_format=True)
+
+    def index_value(self, val):
+        """
+        Convert value to index type - used for time windows
+        Datetime index: timestamp, ISO string or epoch timestamp for posix format
+        Timedelta index: timedelta or number in unit
+        :param val: value - None is kept
+        :return: pd.Timestamp or pd.Timedelta
+        """
+        if val is None:
+            return None
+        if self.index_type == "datetime":
+            if self.datetime_fmt.startswith('posix') and isinstance(val, (int, float, np.number)):
+                return self.to_datetime([val])[0]
+            return pd.Timestamp(val)
+        if isinstance(val, (dt.timedelta, np.timedelta64)):
+            return pd.Timedelta(val)
+        return pd.Timedelta(float(val), unit=self.unit)
+
+    def parse_index_field(self, field: str):
+        """
+        Convert index field of a text file line to index type
+        :param field: field
+        :return: pd.Timestamp or pd.Timedelta
+        """
+        if self.index_type == "datetime":
+            return self.to_datetime([float(field) if self.datetime_fmt.startswith('posix') else field])[0]
+        return pd.Timedelta(float(field), unit=self.unit)
+
+    @staticmethod
+    def select_window(df: pd.DataFrame, start=None, stop=None):
+        """
+        Select rows with index in [start, stop]
+        @param df: dataframe
+        @param start: first index value - None: no limit
+        @param stop: last index value - None: no limit
+        @return: df
+        """
+        if start is None and stop is None:
+            return df
+        if df.index.is_monotonic_increasing:
+            return df.loc[start:stop]
+        in_window = np.ones(df.shape[0], dtype=bool)
+        if start is not None:
+            in_window &= df.index >= start
+        if stop is not None:
+            in_window &= df.index <= stop
+        return df[in_window]
+
+    def get_text_source(self, path="", sep=",", names=None, start=None, stop=None):
+        """
+        Get source for pandas text readers: lines with index in [start, stop] - file must be sorted by index.
+        For regular expression or multi-character separators, the whole file is read and the window is selected
+        after parsing.
+        @param path: path to file
+        @param sep: separator
+        @param names: column names if file has no header
+        @param start: first index value
+        @param stop: last index value
+        @return: path or file-like object
+        """
+        if start is None and stop is None:
+            return path
+        window = text_window.read_window(path, self.parse_index_field, self.index_col, sep, names, start, stop)
+        return window if window is not None else path
 
     def set_index(self, df: pd.DataFrame):
         """
-        Set dataframe index to selected column
+        Set dataframe index to selected column - df is modified in place.
+        If the reader already set the index column as index, only the index is converted.
         Creates datetime index if necessary
         @param df: dataframe to modify
         @return: modified df
         """
         if self.index_col in df.columns:
-            if self.index_type == "datetime":
-                df[self.index_col] = self.to_datetime(df[self.index_col])
-            else:
-                df[self.index_col] = pd.TimedeltaIndex(df[self.index_col], unit=self.unit)
-            df = df.set_index(self.index_col, drop=True)
+            index = self.convert_index(df[self.index_col])
+            del df[self.index_col]
+            df.index = index
+        elif df.index.name == self.index_col and df.index.dtype.kind not in "mM":
+            df.index = self.convert_index(df.index)
+        return df
+
+    def convert_index(self, vals):
+        """
+        Convert index values - datetime or timedelta in unit
+        @param vals: values
+        @return: pd.Index named index_col
+        """
+        if self.index_type == "datetime":
+            index = pd.DatetimeIndex(self.to_datetime(vals))
+        else:
+            index = pd.TimedeltaIndex(vals, unit=self.unit)
+        return index.rename(self.index_col)
+
+    def get_reader_index_col(self, columns: List[str] = None):
+        """
+        Get index_col argument for pandas readers - the index is set while reading if the index column is in the file
+        @param columns: columns in file
+        @return: name of index column or None
+        """
+        return self.index_col if columns is not None and self.index_col in columns else None
+
+    @staticmethod
+    def get_header(source, sep=","):
+        """
+        Get column names from first line of text file
+        @param source: path or file-like object
+        @param sep: separator
+        @return: list of column names
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                header = f.readline()
+        else:
+            header = source.readline()
+            source.seek(0)
+        split_fields = text_window.get_field_splitter(sep)
+        if split_fields is not None:
+            return split_fields(header.decode())
+        # Regular expression separators: pandas does not remove quotes
+        return re.split(sep or ",", header.decode().rstrip("\r\n"))
+
+    def get_source_files(self, filename=""):
+        """
+        Get paths of all files read by read_file - override if necessary
+        @param filename: path to file
+        @return: list of paths
+        """
+        return [self.add_extension(filename, self.file_extension)]
+
+    def config_key(self, **kwargs):
+        """
+        Create key of configuration (to_json) and import arguments
+        @return: key (str)
+        """
+        config = {name: val for name, val in json.loads(self.to_json())["Parameters"].items()
+                  if name != "cache_dir" and not name.endswith("_")}
+        key = hashlib.sha1(json.dumps([self.__class__.__name__, config], sort_keys=True, default=str).encode())
+        key.update(repr(sorted(kwargs.items())).encode())
+        return key.hexdigest()
+
+    def cache_key(self, filename="", **kwargs):
+        """
+        Create key for cached data.
+        Hash of configuration (to_json), import arguments and size and modification time of source files.
+        @param filename: path to file
+        @return: key (str)
+        """
+        key = hashlib.sha1(self.config_key(**kwargs).encode())
+        for path in self.get_source_files(filename):
+            stat = os.stat(path)
+            key.update(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return key.hexdigest()[:16]
+
+    def get_cache_name(self, filename=""):
+        """
+        Get name of cache entries of a file - filename and hash of the directory,
+        so files with the same name in different directories have different entries
+        @param filename: path to file
+        @return: name (str)
+        """
+        directory = os.path.dirname(os.path.realpath(filename))
+        return f"{self.get_filename(filename)}_{hashlib.sha1(directory.encode()).hexdigest()[:8]}"
+
+    def _import_cached(self, filename="", feature_types=None, report: ImportReport = None, **kwargs):
+        """
+        Import data using cache. Cached data is memory-mapped (copy on write).
+        Outdated cache entries of the file are removed.
+        @param filename: path to file
+        @param feature_types: dict feature name: declared type
+        @param report: ImportReport (optional) - stages are recorded
+        @return: pd.Dataframe
+        """
+        name = self.get_cache_name(filename)
+        cache_path = os.path.join(self.cache_dir, f"{name}_{self.cache_key(filename, feature_types=feature_types, **kwargs)}")
+        if columnar.columnar_exists(cache_path):
+            return run_stage(report, "read_cache", columnar.read_columnar, None, cache_path, mmap_mode="c")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        pattern = re.compile(rf"{re.escape(name)}_[0-9a-f]{{16}}")
+        for entry in set(file.split(".")[0] for file in os.listdir(self.cache_dir)):
+            if pattern.fullmatch(entry):
+                columnar.remove_columnar(os.path.join(self.cache_dir, entry))
+        df = run_stage(report, "read_file", self.read_file, None, filename, **kwargs)
+        df = run_stage(report, "select_columns", self.select_columns, df, kwargs.get('usecols'))
+        df = self.process_data(df, feature_types=feature_types, start=kwargs.get('start'), stop=kwargs.get('stop'),
+                               report=report)
+        run_stage(report, "write_cache", columnar.write_columnar, df, cache_path)
         return df
 
+    def get_usecols(self, columns: List[str] = None, feature_set=None):
+        """
+        Get columns to read from file - names are mapped to the names before renaming, index column is added.
+        @param columns: columns to import (names after renaming)
+        @param feature_set: FeatureSet - inputs and outputs are used if columns is None
+        @return: sorted list of column names in file - None: all columns
+        """
+        if columns is None and feature_set is not None and feature_set.features:
+            columns = feature_set.get_input_feature_names() + feature_set.get_output_feature_names()
+        if columns is None:
+            return None
+        names_in_file = {new_name: name for name, new_name in self.cols_to_rename.items()}
+        return sorted(set(names_in_file.get(col, col) for col in columns if col not in self.cols_to_drop) | {self.index_col})
+
+    def usecols_filter(self, usecols: List[str] = None):
+        """
+        Create usecols argument for pandas readers - columns that are not in the file are ignored.
+        Dropped columns are not read.
+        @param usecols: list of columns - None: all columns
+        @return: callable or None
+        """
+        if usecols is None:
+            dropped = self.get_dropped_columns()
+            return (lambda col: col not in dropped) if dropped else None
+        usecols = set(usecols)
+        return lambda col: col in usecols
+
+    def get_dropped_columns(self):
+        """
+        Get names in file of columns to drop - cols_to_drop are names after renaming
+        @return: set of column names
+        """
+        renamed = {name for name, new_name in self.cols_to_rename.items() if new_name not in self.cols_to_drop}
+        names_in_file = {new_name: name for name, new_name in self.cols_to_rename.items()}
+        return set(names_in_file.get(col, col) for col in self.cols_to_drop) - renamed - {self.index_col}
+
+    @staticmethod
+    def select_columns(df: pd.DataFrame, usecols: List[str] = None):
+        """
+        Select columns - for readers that do not support usecols
+        @param df: dataframe
+        @param usecols: list of columns
+        @return: df
+        """
+        if usecols is None or all(col in usecols for col in df.columns):
+            return df
+        return df[[col for col in df.columns if col in usecols]]
+
     def read_file(self, filename="", **kwargs):
         """
         Get dataframe from file - override this!
@@ -89,32 +636,156 @@ class DataImport(JSONInterface):
         """
         return pd.DataFrame()
 
-    def fill_missing_vals(self, df: pd.DataFrame):
+    def read_chunks(self, filename="", chunksize=100000, **kwargs):
+        """
+        Get dataframe chunks from file - override this for readers supporting chunks!
+        Default: read whole file and split it.
+        @param filename: path to file
+        @param chunksize: number of rows per chunk
+        @return: generator of df
+        """
+        df = self.read_file(filename, **kwargs)
+        for start in range(0, df.shape[0], chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    def read_new_rows(self, filename="", position=0, **kwargs):
+        """
+        Get rows added to file after position - override this for readers supporting incremental reads!
+        Default: read whole file, position is number of rows.
+        @param filename: path to file
+        @param position: position returned by previous call - 0: start of file
+        @return: df of new rows (None if no new rows), new position
+        """
+        df = self.read_file(filename, **kwargs)
+        if df.shape[0] <= position:
+            return None, position
+        return df.iloc[position:], df.shape[0]
+
+    def fill_missing_vals(self, df: pd.DataFrame, state: dict = None):
         """
             Fill missing values
             @param df: dataframe to modify
+            @param state: resampling state - continues the time grid of the previous chunk
             @return: modified df
         """
         if isinstance(df.index, pd.DatetimeIndex):
-            df = df.reindex(pd.date_range(df.index[0], df.index[-1], freq=self.freq), fill_value=np.nan)
-            return df.resample(self.freq).first()
+            if state is None:
+                df = df.reindex(pd.date_range(df.index[0], df.index[-1], freq=self.freq), fill_value=np.nan)
+                return df.resample(self.freq).first()
+            if df.empty:
+                return df
+            start = state.get('next_timestamp', df.index[0])
+            origin = state.setdefault('origin', start.normalize())
+            df = df.reindex(pd.date_range(start, df.index[-1], freq=self.freq), fill_value=np.nan)
+            if df.empty:
+                return df
+            state['next_timestamp'] = df.index[-1] + to_offset(self.freq)
+            return df.resample(self.freq, origin=origin).first()
         return df
 
     def rename_columns(self, df: pd.DataFrame):
         """
-            Rename columns
+            Rename columns - df is modified in place
             @param df: dataframe to modify
             @return: modified df
         """
-        return df.rename(self.cols_to_rename, axis=1)
+        if any(col in self.cols_to_rename for col in df.columns):
+            df.columns = [self.cols_to_rename.get(col, col) for col in df.columns]
+        return df
 
     def drop_columns(self, df: pd.DataFrame):
         """
-            Drop columns
+            Drop columns - dropped columns are usually not read, see usecols_filter
+            @param df: dataframe to modify
+            @return: modified df
+        """
+        cols_to_drop = [col for col in self.cols_to_drop if col in df.columns]
+        return df.drop(cols_to_drop, axis=1) if cols_to_drop else df
+
+    def to_float(self, df: pd.DataFrame):
+        """
+            Convert all columns to float - index column is kept as float64. Columns with matching dtype are not copied.
+            @param df: dataframe to modify
+            @return: modified df
+        """
+        dtypes = {}
+        for col, dtype in df.dtypes.items():
+            target = np.dtype('float' if col == self.index_col else self.float_dtype)
+            if dtype != target:
+                dtypes[col] = target
+        return df.astype(dtypes, copy=False) if dtypes else df
+
+    def set_dtypes(self, df: pd.DataFrame, feature_types: dict = None):
+        """
+            Set dtypes of columns:
+            - declared feature types: Real - float_dtype, Int - integer, Bool - bool
+              Int and Bool are only applied to columns without missing values
+            - float columns: float_dtype
+            - integer columns: smallest integer type if compact_ints is set
             @param df: dataframe to modify
+            @param feature_types: dict feature name: declared type
             @return: modified df
         """
-        return df.drop(self.cols_to_drop, axis=1, errors='ignore')
+        feature_types = feature_types if feature_types is not None else {}
+        dtypes = {}
+        for col, dtype in df.dtypes.items():
+            if dtype.kind not in "biuf":
+                continue
+            declared_type = str(feature_types.get(col, "")).lower()
+            target = self._get_declared_dtype(df[col], declared_type) if declared_type in ["int", "bool"] else None
+            if target is None:
+                if dtype.kind == "f" or declared_type == "real":
+                    target = self.float_dtype
+                elif dtype.kind in "iu" and self.compact_ints:
+                    target = self._get_int_dtype(df[col])
+            if target is not None and dtype != np.dtype(target):
+                dtypes[col] = target
+        return df.astype(dtypes, copy=False) if dtypes else df
+
+    def _get_declared_dtype(self, vals: pd.Series, declared_type="int"):
+        """
+        Get dtype for declared type Int or Bool - None if values cannot be converted
+        @param vals: values
+        @param declared_type: int or bool
+        @return: dtype
+        """
+        if vals.isna().any():
+            return None
+        if declared_type == "bool":
+            return np.dtype(bool) if vals.isin([0, 1]).all() else None
+        if vals.dtype.kind == "f" and not (vals % 1 == 0).all():
+            return None
+        return self._get_int_dtype(vals) if self.compact_ints else np.dtype("int64")
+
+    @staticmethod
+    def _get_int_dtype(vals: pd.Series):
+        """
+        Get smallest integer type for values
+        @param vals: values
+        @return: dtype
+        """
+        min_val, max_val = (int(vals.min()), int(vals.max())) if not vals.empty else (0, 0)
+        for dtype in [np.int8, np.int16, np.int32]:
+            if np.iinfo(dtype).min <= min_val and max_val <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+
+    @staticmethod
+    def get_feature_types(feature_set=None):
+        """
+        Get declared types of features
+        @param feature_set: FeatureSet
+        @return: dict feature name: type
+        """
+        if feature_set is None or not feature_set.features:
+            return None
+        return {feature.name: feature.datatype for feature in feature_set.features}
+
+    def _get_attrs(self):
+        """
+        Get attributes of class - internal state (leading underscore) is not stored
+        """
+        return {name: val for name, val in self.__dict__.items() if not name.startswith("_")}
 
     def data_to_file(self, df: pd.DataFrame, filename=""):
         """
@@ -124,14 +795,17 @@ class DataImport(JSONInterface):
         df.to_csv(f'{filename}.csv', index_label=self.index_col)
 
     @staticmethod
-    def df_info(df: pd.DataFrame):
+    def df_info(df: pd.DataFrame, report: ImportReport = None):
         """
             Get info about df
             @param df: dataframe to get info of
+            @param report: ImportReport (optional) - printed after dtypes
         """
         if df is not None:
             df.info()
             print(df.dtypes)
+        if report is not None:
+            print(report)
 
 
     @staticmethod
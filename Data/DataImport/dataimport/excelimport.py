@@ -1,25 +1,130 @@
+import os
+import re
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List
 import pandas as pd
 
 from . import DataImport
+from . import columnar
+
+
+def read_sheet(path="", sheet_name="", usecols: List[str] = None):
+    """
+    Read sheet of xlsx workbook using streaming read-only parser. First row is header, empty rows are skipped.
+    @param path: path to workbook
+    @param sheet_name: name of sheet
+    @param usecols: columns to read - None: all columns
+    @return: dataframe
+    """
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = list(next(rows, []))
+        positions = [i for i, name in enumerate(header) if name is not None and (usecols is None or name in usecols)]
+        records = [[row[i] if i < len(row) else None for i in positions] for row in rows if any(val is not None for val in row)]
+    finally:
+        workbook.close()
+    return pd.DataFrame.from_records(records, columns=[header[i] for i in positions])
 
 
 class ExcelImport(DataImport):
     """
     Data import for excel files.
     Supports xls and xlsx format.
+    Sheets of xlsx workbooks can be read in parallel using a streaming parser.
+    Converted workbooks are stored in a binary file next to the workbook and reused while the workbook is unchanged.
     """
     fmt: str = 'xlsx'
+    sheets: List[str] = None
+    workers: int = 1
+    convert: bool = False
 
-    def __init__(self, fmt='xlsx', **kwargs):
+    def __init__(self, fmt='xlsx', sheets=None, workers=1, convert=False, **kwargs):
+        """
+        @param sheets: names of sheets to read - rows are concatenated. None: first sheet, "all": all sheets
+        @param workers: number of worker processes for reading sheets - xlsx only
+        @param convert: store converted workbook in binary file and read this file while the workbook is unchanged
+        """
         super().__init__(**kwargs)
         self.fmt = fmt
+        self.sheets = sheets
+        self.workers = workers
+        self.convert = convert
 
-    def read_file(self, filename="", **kwargs):
+    def read_file(self, filename="", usecols=None, **kwargs):
         """
         Read excel file
+        @param usecols: columns to read - None: all columns
+        @return: dataframe
+        """
+        path = self.add_extension(filename, self.fmt)
+        if self.convert:
+            return self.select_columns(self._read_converted(path), usecols)
+        return self._read_workbook(path, usecols)
+
+    def _read_workbook(self, path="", usecols=None):
+        """
+        Parse workbook - xlsx workbooks are read with the streaming parser if converted or read in parallel
+        @param path: path to workbook
+        @param usecols: columns to read - None: all columns
         @return: dataframe
         """
-        return pd.read_excel(self.add_extension(filename,self.fmt))
+        if self.fmt == 'xls' or not (self.convert or self.workers > 1):
+            sheet_name = 0 if self.sheets is None else None if self.sheets == "all" else list(self.sheets)
+            df = pd.read_excel(path, sheet_name=sheet_name, usecols=self.usecols_filter(usecols))
+            return pd.concat(df.values(), ignore_index=True) if isinstance(df, dict) else df
+        sheets = self.get_sheet_names(path)
+        if self.workers > 1 and len(sheets) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(sheets))) as executor:
+                dfs = list(executor.map(partial(read_sheet, path, usecols=usecols), sheets))
+        else:
+            dfs = [read_sheet(path, sheet, usecols) for sheet in sheets]
+        return pd.concat(dfs, ignore_index=True)
+
+    def get_sheet_names(self, path=""):
+        """
+        Get names of sheets to read
+        @param path: path to xlsx workbook
+        @return: list of sheet names
+        """
+        if self.sheets is not None and self.sheets != "all":
+            return list(self.sheets)
+        import openpyxl
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        try:
+            return workbook.sheetnames if self.sheets == "all" else workbook.sheetnames[:1]
+        finally:
+            workbook.close()
+
+    def _read_converted(self, path=""):
+        """
+        Read converted workbook - the workbook is parsed and converted if it was changed.
+        Converted files of previous versions of the workbook are removed.
+        @param path: path to workbook
+        @return: dataframe - all columns
+        """
+        stat = os.stat(path)
+        key = hashlib.sha1(f"{self.sheets}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+        converted_path = f"{path}_{key}"
+        if columnar.columnar_exists(converted_path):
+            return columnar.read_columnar(converted_path, mmap_mode="c")
+        dir, name = os.path.split(os.path.abspath(path))
+        pattern = re.compile(rf"({re.escape(name)}_[0-9a-f]{{16}})\.(pkl|npy|npz|index\.npy|json)")
+        for match in filter(None, map(pattern.fullmatch, os.listdir(dir))):
+            columnar.remove_columnar(os.path.join(dir, match.group(1)))
+        df = self._read_workbook(path)
+        columnar.write_columnar(df, converted_path)
+        return df
+
+    def get_source_files(self, filename=""):
+        """
+        Get paths of all files read by read_file
+        @return: list of paths
+        """
+        return [self.add_extension(filename, self.fmt)]
 
     def data_to_file(self, df: pd.DataFrame, filename=""):
         """
@@ -27,4 +132,4 @@ class ExcelImport(DataImport):
         @param df: dataframe
         @param filename: path to store file
         """
-        df.to_excel(self.add_extension(filename, self.fmt))
\ No newline at end of file
+        df.to_excel(self.add_extension(filename, self.fmt))
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
 
 from . import DataImport
 
@@ -8,24 +9,153 @@ class HDFImport(DataImport):
     """
     Data import for HDF5 files.
     """
-    def read_file(self, filename="", **kwargs):
+    file_extension = "hd5"
+
+    def read_file(self, filename="", usecols=None, start=None, stop=None, **kwargs):
         """
-         Get dataframe from file
+         Get dataframe from file - column and window selection is only applied while reading for table format
+         @param usecols: columns to read - None: all columns
+         @param start: first index value
+         @param stop: last index value
          @return: df
          """
-        df = pd.read_hdf(self.add_extension(filename,'hd5'))
-        return df.astype('float')
+        with pd.HDFStore(self.add_extension(filename, 'hd5'), mode='r') as store:
+            key = store.keys()[0]
+            where = None
+            if store.get_storer(key).is_table:
+                where = [term for term, val in [("index >= start", start), ("index <= stop", stop)] if val is not None]
+            df = store.select(key, where=where or None, columns=self._get_table_columns(store, key, usecols))
+        return self.to_float(self.select_columns(df, usecols))
+
+    def read_chunks(self, filename="", chunksize=100000, usecols=None, **kwargs):
+        """
+        Get dataframe chunks from file - only table format supports chunks,
+        fixed format files are read completely and split.
+        @param usecols: columns to read - None: all columns
+        @return: generator of df
+        """
+        with pd.HDFStore(self.add_extension(filename, 'hd5'), mode='r') as store:
+            key = store.keys()[0]
+            if store.get_storer(key).is_table:
+                for chunk in store.select(key, chunksize=chunksize, columns=self._get_table_columns(store, key, usecols)):
+                    yield self.to_float(chunk)
+                return
+        yield from super().read_chunks(filename, chunksize, usecols=usecols, **kwargs)
+
+    def read_new_rows(self, filename="", position=0, usecols=None, **kwargs):
+        """
+        Get rows added to file after position - fixed format files are read completely
+        @param position: number of rows returned by previous call - 0: start of file
+        @param usecols: columns to read - None: all columns
+        @return: df of new rows (None if no new rows), new position
+        """
+        with pd.HDFStore(self.add_extension(filename, 'hd5'), mode='r') as store:
+            key = store.keys()[0]
+            storer = store.get_storer(key)
+            if storer.is_table:
+                if storer.nrows <= position:
+                    return None, position
+                df = store.select(key, start=position, columns=self._get_table_columns(store, key, usecols))
+                return self.to_float(df), storer.nrows
+        return super().read_new_rows(filename, position, usecols=usecols, **kwargs)
+
+    def _get_table_columns(self, store: pd.HDFStore, key: str, usecols=None):
+        """
+        Get columns argument for select - only supported for table format
+        @param store: HDF store
+        @param key: key of dataframe
+        @param usecols: columns to read
+        @return: list of columns in table or None
+        """
+        storer = store.get_storer(key)
+        usecols_filter = self.usecols_filter(usecols)
+        if usecols_filter is None or not storer.is_table:
+            return None
+        return [col for col in storer.non_index_axes[0][1] if usecols_filter(col)]
 
-    def fill_missing_vals(self, df: pd.DataFrame):
+    def fill_missing_vals(self, df: pd.DataFrame, state: dict = None):
         """
             Fill missing values
+            - resample to freq: first value of each interval (only values on the minute grid of the first timestamp)
+            - fill missing values from the same time of day of previous days
+            Intervals between the first and the last timestamp are created, even if they contain no values.
             @param df: dataframe to modify
+            @param state: resampling state - carries the time grid across chunks, holds back the last interval
+            and the last day of the previous chunk
             @return: modified df
         """
-        df = df.reindex(pd.DatetimeIndex(pd.date_range(df.index[0], df.index[-1], freq='min')), fill_value=np.nan)
-        df = df.resample(self.freq).first()
-        df = df.where(df.isna() == False)
-        df = df.copy().groupby(df.index.time).ffill() # TODO check this
+        state = {'final': True} if state is None else state
+        chunk, df = df, self._hold_back_last_interval(df, state)
+        if df is None:
+            return chunk.iloc[:0]
+        on_minute_grid = (df.index - state['origin']) % pd.Timedelta(minutes=1) == pd.Timedelta(0)
+        if not on_minute_grid.all():
+            df = df[on_minute_grid]
+        df = df.resample(self.freq, origin=state['start_day']).first().reindex(state.pop('intervals'))
+        previous = state.get('previous')
+        if previous is not None:
+            df = pd.concat([previous, df])
+        df = self.ffill_time_of_day(df)
+        if not df.empty:
+            state['previous'] = df[df.index > df.index[-1] - pd.Timedelta(days=1)]
+        return df.iloc[previous.shape[0]:] if previous is not None else df
+
+    def ffill_time_of_day(self, df: pd.DataFrame):
+        """
+        Forward fill missing values from the same time of day.
+        For a regular index, values are reshaped to (days, intervals per day, columns)
+        and filled along the days axis in one pass.
+        @param df: resampled dataframe - index with frequency freq
+        @return: filled df
+        """
+        interval = pd.Timedelta(to_offset(self.freq))
+        values = df.to_numpy()
+        num_slots = pd.Timedelta(days=1) // interval
+        is_regular = df.shape[0] < 2 or (np.diff(df.index.asi8) == interval.value).all()
+        if df.empty or pd.Timedelta(days=1) % interval != pd.Timedelta(0) or values.dtype.kind != 'f' or not is_regular:
+            return df.groupby(df.index.time).ffill()
+        # Pad to full days
+        offset = (df.index[0] - df.index[0].normalize()) // interval
+        num_days = -(-(offset + df.shape[0]) // num_slots)
+        padded = np.full((num_days * num_slots, df.shape[1]), np.nan, dtype=values.dtype)
+        padded[offset:offset + df.shape[0]] = values
+        padded = padded.reshape((num_days, num_slots, df.shape[1]))
+        # Index of last valid day for each time of day
+        days = np.where(np.isnan(padded), 0, np.arange(num_days, dtype=np.int32)[:, None, None])
+        np.maximum.accumulate(days, axis=0, out=days)
+        filled = np.take_along_axis(padded, days, axis=0).reshape((-1, df.shape[1]))
+        return pd.DataFrame(filled[offset:offset + df.shape[0]], index=df.index, columns=df.columns, copy=False)
+
+    def _hold_back_last_interval(self, df: pd.DataFrame, state: dict):
+        """
+        Prepend rows held back from previous chunk, hold back rows of last resampling interval.
+        The last interval may be continued by the next chunk - it is only resampled for the final chunk.
+        The time grid is set by the first timestamp of the first chunk: state keys origin (minute grid),
+        start_day (origin of intervals) and next_interval (first interval not resampled yet).
+        Sets state['intervals'] - intervals to create from the returned rows.
+        @param df: dataframe chunk
+        @param state: resampling state
+        @return: rows that can be resampled - None if there are no intervals to create
+        """
+        if state.get('tail') is not None:
+            df = pd.concat([state['tail'], df])
+        state['tail'] = None
+        if df.empty:
+            return None
+        interval = pd.Timedelta(to_offset(self.freq))
+        if 'origin' not in state:
+            state['origin'] = df.index[0]
+            state['start_day'] = df.index[0].normalize()
+            state['next_interval'] = state['start_day'] + (df.index[0] - state['start_day']) // interval * interval
+        last_interval = state['start_day'] + (df.index[-1] - state['start_day']) // interval * interval
+        if not state.get('final', True):
+            state['tail'] = df[df.index >= last_interval]
+            df = df[df.index < last_interval]
+            last_interval -= interval
+        if last_interval < state['next_interval']:
+            return None
+        state['intervals'] = pd.date_range(state['next_interval'], last_interval, freq=interval)
+        state['next_interval'] = last_interval + interval
         return df
 
     def data_to_file(self, df: pd.DataFrame, filename=""):
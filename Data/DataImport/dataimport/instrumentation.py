@@ -0,0 +1,128 @@
+"""
+Instrumentation of the import pipeline.
+For each stage, wall time, rows in and out, increase of the peak RSS of the process and, optionally,
+tracemalloc peak are recorded.
+"""
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from typing import List
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def get_peak_rss():
+    """
+    Get peak resident set size of the process
+    @return: bytes - None if not supported
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: kilobytes, macOS: bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class StageReport:
+    """
+    Measurements of one stage
+    """
+    name: str = ""
+    wall_time: float = 0.0
+    rows_in: int = None
+    rows_out: int = None
+    tracemalloc_peak: int = None
+    peak_rss: int = None
+    peak_rss_delta: int = None
+
+
+@dataclass
+class ImportReport:
+    """
+    Report of import stages.
+    Pass an instance to DataImport.import_data to record the stages.
+    trace_memory: record tracemalloc peak - tracing slows down the stages, so wall times are higher
+    """
+    trace_memory: bool = False
+    stages: List[StageReport] = field(default_factory=list)
+
+    def run_stage(self, name, func, df=None, *args, **kwargs):
+        """
+        Run stage and record measurements
+        @param name: name of stage
+        @param func: function to run
+        @param df: input dataframe - passed as first argument if not None
+        @return: result of func
+        """
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        traced_start = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        rss_start = get_peak_rss()
+        start = time.perf_counter()
+        result = func(*args, **kwargs) if df is None else func(df, *args, **kwargs)
+        wall_time = time.perf_counter() - start
+        stage = StageReport(name, wall_time,
+                            rows_in=len(df) if df is not None else None,
+                            rows_out=len(result) if hasattr(result, "__len__") else None)
+        if self.trace_memory:
+            stage.tracemalloc_peak = tracemalloc.get_traced_memory()[1] - traced_start
+        if tracing:
+            tracemalloc.stop()
+        if rss_start is not None:
+            stage.peak_rss = get_peak_rss()
+            stage.peak_rss_delta = stage.peak_rss - rss_start
+        self.stages.append(stage)
+        return result
+
+    @property
+    def wall_time(self):
+        """
+        Total wall time of all stages
+        """
+        return sum(stage.wall_time for stage in self.stages)
+
+    def to_dict(self):
+        """
+        Get report as dict - e.g. for json export
+        @return: dict
+        """
+        return {"wall_time": self.wall_time, "stages": [asdict(stage) for stage in self.stages]}
+
+    def __str__(self):
+        lines = [f"{'stage':<20}{'time [s]':>10}{'rows in':>12}{'rows out':>12}{'traced [MB]':>13}{'RSS delta [MB]':>16}"]
+        for stage in self.stages:
+            lines.append(f"{stage.name:<20}{stage.wall_time:>10.3f}{_format(stage.rows_in, 1):>12}{_format(stage.rows_out, 1):>12}"
+                         f"{_format(stage.tracemalloc_peak, 1e6):>13}{_format(stage.peak_rss_delta, 1e6):>16}")
+        lines.append(f"{'total':<20}{self.wall_time:>10.3f}")
+        return "\n".join(lines)
+
+
+def run_stage(report: ImportReport = None, name="", func=None, df=None, *args, **kwargs):
+    """
+    Run stage - measurements are recorded if report is given
+    @param report: ImportReport or None
+    @param name: name of stage
+    @param func: function to run
+    @param df: input dataframe - passed as first argument if not None
+    @return: result of func
+    """
+    if report is not None:
+        return report.run_stage(name, func, df, *args, **kwargs)
+    return func(*args, **kwargs) if df is None else func(df, *args, **kwargs)
+
+
+def _format(val, scale=1):
+    """
+    Format value for report table - None is shown as -
+    """
+    if val is None:
+        return "-"
+    return f"{val / scale:.1f}" if scale != 1 else str(val)
@@ -0,0 +1,58 @@
+import os
+import pandas as pd
+
+from . import DataImport
+from . import columnar
+
+
+class NpyMemmapImport(DataImport):
+    """
+    Data import for NumPy files.
+    Values are stored column-major in <filename>.npy with index (<filename>.index.npy)
+    and sidecar (<filename>.json) - see columnar module.
+    Supports: memory-mapped loading - no copy, file pages can be shared between processes.
+    Archive format (npz) is loaded to memory.
+    """
+    file_extension = "npy"
+    mmap_mode: str = "r"
+    archive: bool = False
+
+    def __init__(self, mmap_mode="r", archive=False, **kwargs):
+        super().__init__(**kwargs)
+        self.mmap_mode = mmap_mode
+        self.archive = archive
+
+    def read_file(self, filename="", usecols=None, **kwargs):
+        """
+         Get dataframe from file - only selected columns are copied from the memory-mapped file
+         @param usecols: columns to read - None: all columns
+         @return: df
+         """
+        df = columnar.read_columnar(self._get_base_path(filename), mmap_mode=self.mmap_mode)
+        return self.select_columns(df, usecols)
+
+    def get_source_files(self, filename=""):
+        """
+        Get paths of all files read by read_file
+        @return: list of paths
+        """
+        path = self._get_base_path(filename)
+        return [file for file in [f"{path}.{ext}" for ext in ["npy", "npz", "index.npy", "json", "pkl"]] if os.path.exists(file)]
+
+    def data_to_file(self, df: pd.DataFrame, filename=""):
+        """
+        Store data to file
+        @param df: dataframe
+        @param filename: path to store file
+        """
+        columnar.write_columnar(df, self._get_base_path(filename), archive=self.archive)
+
+    @staticmethod
+    def _get_base_path(filename=""):
+        """
+        Get path without extension - removes npy, npz extension
+        @param filename: path
+        @return: path without extension
+        """
+        root, extension = os.path.splitext(filename)
+        return root if extension in [".npy", ".npz"] else filename
@@ -0,0 +1,133 @@
+"""
+Read parts of text files without parsing the whole file.
+- Time window: the first and last line of the window are located by binary search over byte offsets,
+  lines before the window are never parsed. The file must be sorted by index.
+  Fields are split like the pandas C parser (single character separator, quoted fields) -
+  regular expression or multi-character separators are not supported.
+- Tail: lines appended after a byte offset
+- Parts: line-aligned byte ranges for parsing a file in parallel
+"""
+import io
+import os
+import csv
+
+
+def next_line_start(f, offset, data_start=0):
+    """
+    Get offset of first line starting at or after offset
+    @param f: file opened in binary mode
+    @param offset: byte offset
+    @param data_start: offset of first data line
+    @return: offset
+    """
+    if offset <= data_start:
+        return data_start
+    f.seek(offset - 1)
+    f.readline()
+    return f.tell()
+
+
+def find_line_offset(f, target, key, data_start, end, right=False):
+    """
+    Binary search: offset of first line with key(line) >= target (right: key(line) > target)
+    @param f: file opened in binary mode
+    @param target: index value
+    @param key: function line (bytes) -> index value
+    @param data_start: offset of first data line
+    @param end: size of file
+    @param right: search first line with key > target
+    @return: offset
+    """
+    low, high = data_start, end
+    while low < high:
+        mid = (low + high) // 2
+        offset = next_line_start(f, mid, data_start)
+        line = f.readline() if offset < end else b""
+        if not line.strip():
+            found = True
+        else:
+            value = key(line)
+            found = value > target if right else value >= target
+        if found:
+            high = mid
+        else:
+            low = mid + 1
+    return next_line_start(f, low, data_start)
+
+
+def get_field_splitter(sep=","):
+    """
+    Get function splitting a line into fields - quoted fields are handled like the pandas C parser
+    @param sep: separator
+    @return: function line (str) -> list of fields - None if sep is a regular expression or has multiple characters
+    """
+    if sep is None or len(sep) != 1:
+        return None
+
+    def split_fields(line):
+        return next(csv.reader([line.rstrip("\r\n")], delimiter=sep, quotechar='"', doublequote=True), [""])
+    return split_fields
+
+
+def read_window(path, parse_index, index_col, sep=",", names=None, start=None, stop=None):
+    """
+    Read lines of a sorted text file with index in [start, stop]
+    @param path: path to file
+    @param parse_index: function index field (str) -> index value
+    @param index_col: name of index column
+    @param sep: separator - single character
+    @param names: column names - if None, first line of file is used as header
+    @return: file-like object containing header and lines in window -
+    None if index column not found or sep is not supported (see get_field_splitter)
+    """
+    split_fields = get_field_splitter(sep)
+    if split_fields is None:
+        return None
+    with open(path, "rb") as f:
+        header = f.readline() if names is None else b""
+        columns = names if names is not None else split_fields(header.decode())
+        if index_col not in columns:
+            return None
+        position = list(columns).index(index_col)
+        data_start = f.tell()
+        end = f.seek(0, os.SEEK_END)
+
+        def key(line):
+            return parse_index(split_fields(line.decode())[position])
+
+        low = find_line_offset(f, start, key, data_start, end) if start is not None else data_start
+        high = find_line_offset(f, stop, key, data_start, end, right=True) if stop is not None else end
+        f.seek(low)
+        return io.BytesIO(header + f.read(max(high - low, 0)))
+
+
+def read_from_offset(path, offset=0, names=None):
+    """
+    Read complete lines from offset to end of file - an incomplete last line is not read
+    @param path: path to file
+    @param offset: byte offset - 0: start of file
+    @param names: column names - if None, first line of file is used as header
+    @return: file-like object containing header and new lines (None if there are no new lines), offset after last line
+    """
+    with open(path, "rb") as f:
+        header = f.readline() if names is None else b""
+        offset = max(offset, f.tell())
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        return None, offset
+    return io.BytesIO(header + data[:end]), offset + end
+
+
+def split_lines(path, parts=1):
+    """
+    Split file into line-aligned byte ranges of similar size
+    @param path: path to file
+    @param parts: number of ranges
+    @return: list of (offset, size) - empty ranges are omitted
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        offsets = [next_line_start(f, end * i // parts) for i in range(parts)] + [end]
+    return [(low, high - low) for low, high in zip(offsets[:-1], offsets[1:]) if high > low]
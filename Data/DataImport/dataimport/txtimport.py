@@ -1,24 +1,97 @@
+import importlib.util
 import pandas as pd
 from . import DataImport
+from . import text_window
+
+
+def pyarrow_available():
+    """
+    Check if pyarrow engine is supported - requires pyarrow and pandas >= 1.4
+    """
+    version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return version >= (1, 4) and importlib.util.find_spec("pyarrow") is not None
 
 
 class TXTImport(DataImport):
     """
     Data import for Octave TXT files.
+    Parser engines: c, python, pyarrow (multithreaded), auto: pyarrow if available, else c
     """
     sep = " "
+    file_extension = "txt"
+    engine: str = "c"
 
-    def __init__(self, sep=" ", **kwargs):
+    def __init__(self, sep=" ", engine="c", **kwargs):
         super().__init__(**kwargs)
         self.sep = sep
+        self.engine = engine
 
-    def read_file(self, filename="", **kwargs):
+    def read_file(self, filename="", usecols=None, start=None, stop=None, **kwargs):
         """
          Get dataframe from file
+         @param usecols: columns to read - None: all columns
+         @param start: first index value - file must be sorted
+         @param stop: last index value - file must be sorted
          @return: df
          """
-        df = pd.read_table(self.add_extension(filename,'txt'), sep=self.sep)
-        return df.astype('float')
+        source = self.get_text_source(self.add_extension(filename, 'txt'), self.sep, start=start, stop=stop)
+        return self.to_float(self.read_table(source, usecols=usecols))
+
+    def read_chunks(self, filename="", chunksize=100000, usecols=None, **kwargs):
+        """
+        Get dataframe chunks from file
+        @param usecols: columns to read - None: all columns
+        @return: generator of df
+        """
+        with pd.read_table(self.add_extension(filename, 'txt'), sep=self.sep, chunksize=chunksize,
+                           engine=self.get_chunk_engine(), usecols=self.usecols_filter(usecols)) as reader:
+            for chunk in reader:
+                yield self.to_float(chunk)
+
+    def read_new_rows(self, filename="", position=0, usecols=None, **kwargs):
+        """
+        Get rows added to file after position
+        @param position: byte offset returned by previous call - 0: start of file
+        @param usecols: columns to read - None: all columns
+        @return: df of new rows (None if no new rows), new position
+        """
+        source, position = text_window.read_from_offset(self.add_extension(filename, 'txt'), position)
+        if source is None:
+            return None, position
+        return self.to_float(self.read_table(source, usecols=usecols)), position
+
+    def read_table(self, source, names=None, usecols=None):
+        """
+        Parse table using selected engine - the index column is set as index while reading
+        @param source: path or file-like object
+        @param names: column names - if None, first line is used as header
+        @param usecols: columns to read - None: all columns
+        @return: df
+        """
+        columns = names if names is not None else self.get_header(source, self.sep)
+        engine = self.get_engine()
+        usecols_filter = self.usecols_filter(usecols)
+        if engine == "pyarrow" and usecols_filter is not None:
+            # pyarrow engine does not support callable usecols
+            usecols_filter = [name for name in columns if usecols_filter(name)]
+        return pd.read_table(source, sep=self.sep, names=names, engine=engine, usecols=usecols_filter,
+                             index_col=self.get_reader_index_col(columns))
+
+    def get_engine(self):
+        """
+        Get parser engine - auto: pyarrow if available, else c
+        @return: engine name for pd.read_table
+        """
+        if self.engine == "auto":
+            return "pyarrow" if pyarrow_available() else "c"
+        return self.engine
+
+    def get_chunk_engine(self):
+        """
+        Get parser engine for chunked reads - pyarrow does not support chunks
+        @return: engine name for pd.read_table
+        """
+        return self.engine if self.engine in ["c", "python"] else "c"
 
     def data_to_file(self, df: pd.DataFrame, filename=""):
         """
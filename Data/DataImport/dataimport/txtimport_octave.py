@@ -1,31 +1,142 @@
-import pandas as pd
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import pandas as pd
 from . import TXTImport
+from . import text_window
+
+
+@lru_cache(maxsize=32)
+def read_header_file(path="", mtime_ns=0, index_header_line=5):
+    """
+    Read octave header file - cached, the modification time invalidates the cache entry
+    @param path: path to header file
+    @param mtime_ns: modification time of header file
+    @param index_header_line: line containing the column names
+    @return: tuple of header lines, column names - None if file has no column names
+    """
+    with open(path, "r") as f:
+        lines = f.readlines()
+    if len(lines) > index_header_line:
+        return tuple(lines[:index_header_line]), tuple(lines[index_header_line].split("\t"))
+    return None
+
+
+def read_numeric_part(path="", offset=0, size=0, sep=" ", names=None, usecols=None, dtypes=None):
+    """
+    Parse part of file containing only numbers
+    @param path: path to file
+    @param offset: byte offset of first line
+    @param size: number of bytes
+    @param names: column names
+    @param usecols: columns to read
+    @param dtypes: dict column name: dtype
+    @return: df
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(size)
+    return pd.read_table(io.BytesIO(data), sep=sep, names=names, usecols=usecols, dtype=dtypes, na_filter=False)
 
 
 class TXTImport_Octave(TXTImport):
     """
     Data import for Octave TXT files.
+    Files containing only numbers can be parsed in parallel - requires header file
     """
     octave_header_file = None
     index_header_line = 5
     octave_header_ = None
+    workers: int = 1
 
-    def __init__(self, use_octave_header=False, octave_header_file=None, index_header_line=5, **kwargs):
+    def __init__(self, use_octave_header=False, octave_header_file=None, index_header_line=5, workers=1, **kwargs):
+        """
+        @param workers: number of worker processes for parsing files containing only numbers
+        """
         super().__init__(**kwargs)
         self.use_octave_header = use_octave_header
         self.octave_header_file = octave_header_file
         self.index_header_line = index_header_line
+        self.workers = workers
 
-    def read_file(self, filename="", **kwargs):
+    def read_file(self, filename="", usecols=None, start=None, stop=None, **kwargs):
         """
          Get dataframe from file
+         @param usecols: columns to read - None: all columns
+         @param start: first index value - file must be sorted
+         @param stop: last index value - file must be sorted
          @return: df
          """
         dir = os.path.join(*os.path.split(filename)[:-1])
         columns = self.read_octave_header(dir)
-        df = pd.read_table(self.add_extension(filename,'txt'), sep=self.sep, names=columns)
-        return df.astype('float')
+        source = self.add_extension(filename, 'txt')
+        if columns is None:
+            return self.to_float(self.read_table(source))
+        if self.workers > 1 and start is None and stop is None:
+            df = self.read_numeric(source, columns, usecols)
+            if df is not None:
+                return df
+        source = self.get_text_source(source, self.sep, names=columns, start=start, stop=stop)
+        return self.to_float(self.read_table(source, names=columns, usecols=usecols))
+
+    def read_chunks(self, filename="", chunksize=100000, usecols=None, **kwargs):
+        """
+        Get dataframe chunks from file
+        @param usecols: columns to read - None: all columns
+        @return: generator of df
+        """
+        dir = os.path.join(*os.path.split(filename)[:-1])
+        columns = self.read_octave_header(dir)
+        with pd.read_table(self.add_extension(filename, 'txt'), sep=self.sep, names=columns, chunksize=chunksize,
+                           engine=self.get_chunk_engine(), usecols=self.usecols_filter(usecols) if columns is not None else None) as reader:
+            for chunk in reader:
+                yield self.to_float(chunk)
+
+    def read_new_rows(self, filename="", position=0, usecols=None, **kwargs):
+        """
+        Get rows added to file after position - requires header file
+        @param position: byte offset returned by previous call - 0: start of file
+        @param usecols: columns to read - None: all columns
+        @return: df of new rows (None if no new rows), new position
+        """
+        dir = os.path.join(*os.path.split(filename)[:-1])
+        columns = self.read_octave_header(dir)
+        if columns is None:
+            return super(TXTImport, self).read_new_rows(filename, position, usecols=usecols, **kwargs)
+        source, position = text_window.read_from_offset(self.add_extension(filename, 'txt'), position, names=columns)
+        if source is None:
+            return None, position
+        return self.to_float(self.read_table(source, names=columns, usecols=usecols)), position
+
+    def read_numeric(self, path="", columns=None, usecols=None):
+        """
+        Parse file containing only numbers - line-aligned parts of the file are parsed by worker processes
+        @param path: path to file
+        @param columns: column names
+        @param usecols: columns to read - None: all columns
+        @return: df - None if file contains non-numeric values
+        """
+        usecols_filter = self.usecols_filter(usecols)
+        names = [name for name in columns if usecols_filter is None or usecols_filter(name)]
+        dtypes = {name: 'float' if name == self.index_col else self.float_dtype for name in names}
+        read_part = partial(read_numeric_part, path, sep=self.sep, names=columns, usecols=names, dtypes=dtypes)
+        parts = text_window.split_lines(path, self.workers)
+        try:
+            with ProcessPoolExecutor(max_workers=len(parts)) as executor:
+                dfs = list(executor.map(read_part, *zip(*parts)))
+        except ValueError:
+            return None
+        return pd.concat(dfs, ignore_index=True)
+
+    def get_source_files(self, filename=""):
+        """
+        Get paths of all files read by read_file - data and header file
+        @return: list of paths
+        """
+        dir = os.path.join(*os.path.split(filename)[:-1])
+        header_file = os.path.join(dir, f'{self.octave_header_file}.head')
+        return super().get_source_files(filename) + ([header_file] if os.path.exists(header_file) else [])
 
     def read_octave_header(self, path=None):
         """
@@ -36,12 +147,10 @@ class TXTImport_Octave(TXTImport):
         """
         path_full = os.path.join(path,f'{self.octave_header_file}.head')
         if os.path.exists(path_full):
-            with open(path_full, "r") as f:
-                lines = f.readlines()
-                if len(lines) > self.index_header_line:
-                    self.octave_header_ = lines[:self.index_header_line]
-                    columns = lines[self.index_header_line].split("\t")
-                    return columns
+            header = read_header_file(path_full, os.stat(path_full).st_mtime_ns, self.index_header_line)
+            if header is not None:
+                self.octave_header_ = list(header[0])
+                return list(header[1])
         return None
 
 
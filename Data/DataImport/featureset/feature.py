@@ -1,9 +1,12 @@
+import sys
 from dataclasses import dataclass
 from typing import List
-import numpy as np
 
+# Features have no instance dict if supported (Python >= 3.10) - compact storage of large interfaces
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class Feature:
     name: str = ""
     models: List[str] = None
@@ -17,6 +20,7 @@ class Feature:
     statistical: bool = False
     init: float = None
     description: str = ""
+    fmu_value_reference: int = None
 
     def get_causality(self):
         for attr in ["input", "output", "parameter"]:
@@ -27,7 +31,7 @@ class Feature:
         return attr is None or getattr(self, attr, False)
 
     def boolean_attrs(self, attrs:List[str]=[]):
-        return np.all(np.array([self.boolean_attr(attr) for attr in attrs]))
+        return all(self.boolean_attr(attr) for attr in attrs)
 
     def is_in_attr_list(self, selector="", value=None):
         list_vals = getattr(self, selector, [])
@@ -1,12 +1,21 @@
-import pandas as pd
+import csv
 from typing import List
-import numpy as np
 
 from .feature import Feature
 
+# Boolean attributes stored in the bitmask of each feature
+FLAGS = {attr: 1 << i for i, attr in enumerate(["static", "input", "output", "parameter", "dynamic", "cyclic", "statistical"])}
+
+
 class FeatureSet:
+    """
+    Set of features.
+    Queries are indexed and memoized - the index is rebuilt if features are added or removed
+    or the features list is replaced. Call clear_cache after modifying attributes of features.
+    """
     fmu_type = None
     features: List[Feature] = None
+    _cache: dict = None
 
     def __init__(self, filename=None):
         if filename is not None:
@@ -14,14 +23,18 @@ class FeatureSet:
 
     def read_interface_file(self, filename):
         """
-        Read interface file - creates features
+        Read interface file - creates features. The file is read once: first line is the FMU type, then a table.
+        Uses the csv module - pandas is not required to load features, e.g. in the FMU runtime.
         @param filename: interface file
         """
         try:
-            first_row = pd.read_csv(filename, nrows=1, sep=';')
-            self.fmu_type = first_row.columns[0]
-            data = pd.read_csv(filename, sep=';', encoding='latin-1', header=0, low_memory=False, skiprows=1)
-            self.features = self._get_selected_features_from_file(data)
+            with open(filename, "r", encoding='latin-1', newline='') as f:
+                reader = csv.reader(f, delimiter=';')
+                self.fmu_type = next(reader)[0]
+                header = next(reader)
+                rows = [row + [""] * (len(header) - len(row)) for row in reader if row]
+            self.features = self._get_features_from_columns({col: list(vals) for col, vals in zip(header, zip(*rows))}
+                                                            if rows else {col: [] for col in header})
         except BaseException as ex:
             print(str(ex))
 
@@ -57,35 +70,34 @@ class FeatureSet:
         return self.get_selected_feats_w_attr(model_name, selector="models", attr="parameter")
 
     def get_output_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_output_feats(model_name))
+        return self.get_selected_feature_names(model_name, attrs=['output'])
 
     def get_static_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_static_feats(model_name))
+        return self.get_selected_feature_names(model_name, attrs=['static'])
 
     def get_dynamic_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_dynamic_feats(model_name))
+        return self.get_selected_feature_names(model_name, attrs=['dynamic'])
 
     def get_input_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_input_feats(model_name))
+        return self.get_selected_feature_names(model_name, attrs=['input'])
 
     def get_dynamic_input_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_selected_feats_w_attrs(model_name, attrs=['input', 'dynamic']))
+        return self.get_selected_feature_names(model_name, attrs=['input', 'dynamic'])
 
     def get_dynamic_output_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_selected_feats_w_attrs(model_name, attrs=['output', 'dynamic']))
+        return self.get_selected_feature_names(model_name, attrs=['output', 'dynamic'])
 
     def get_static_input_feature_names(self, model_name=None):
-        return self.get_feat_names(self.get_selected_feats_w_attrs(model_name, attrs=['input', 'static']))
+        return self.get_selected_feature_names(model_name, attrs=['input', 'static'])
 
     def get_feature_by_name(self, name):
-        for feature in self.features:
-            if feature.name == name:
-                return feature
+        return self._get_cache()["names"].get(name)
 
     ########################### Add / remove features ##################################################################
 
     def add_feature(self, feature):
         self.features.append(feature)
+        self.clear_cache()
 
     def add_cyclic_input_feature(self, name:str=""):
         self.add_feature(Feature(name=name, static=True, cyclic=True, input=True, init=0, models=self.get_output_feature_names()))
@@ -105,36 +117,106 @@ class FeatureSet:
         for feature in self.features:
             if feature.name == name:
                 self.features.remove(feature)
+                self.clear_cache()
                 break
 
     ############################## Helper methods #####################################################################
 
     def get_selected_feats_w_attr(self, value=None, selector="models", attr=None):
-        return [feature for feature in self.features if
-                (value in getattr(feature, selector, []) or value is None) and
-                (getattr(feature, attr, False) or attr is None)]
+        return self.get_selected_feats_w_attrs(value, selector, [attr] if attr is not None else [])
 
     def get_selected_feats_w_attrs(self, value=None, selector="models", attrs: List[str]=None):
-        list_feats = []
-        for feat in self.features:
-            if value in getattr(feat, selector, []) or value is None:
-                if np.all(np.array([getattr(feat, attr, False) for attr in attrs])):
-                    list_feats.append(feat)
-        return list_feats
+        return list(self._query(value, selector, tuple(attrs) if attrs else ()))
+
+    def get_selected_feature_names(self, value=None, selector="models", attrs: List[str]=None):
+        """
+        Get names of features with value in selector and all attributes set - memoized
+        """
+        cache = self._get_cache()
+        key = (value, selector, tuple(attrs) if attrs else ())
+        if key not in cache["feature_names"]:
+            cache["feature_names"][key] = self.get_feat_names(self._query(*key))
+        return list(cache["feature_names"][key])
+
+    def clear_cache(self):
+        """
+        Clear index and memoized queries - required after modifying attributes of features
+        """
+        self._cache = None
+
+    def _get_cache(self):
+        """
+        Get index of features - rebuilt if the features list was replaced or its length changed
+        @return: dict - names: feature by name, masks: bitmask of flags per feature, selectors: feature indices by value,
+        queries: memoized feature queries, feature_names: memoized name queries
+        """
+        features = self.features if self.features is not None else []
+        cache = self._cache
+        if cache is None or cache["features"] is not self.features or cache["num_features"] != len(features):
+            names = {}
+            for feature in features:
+                names.setdefault(feature.name, feature)
+            cache = {"features": self.features, "num_features": len(features), "names": names,
+                     "masks": [sum(bit for attr, bit in FLAGS.items() if getattr(feature, attr, False)) for feature in features],
+                     "selectors": {}, "queries": {}, "feature_names": {}}
+            self._cache = cache
+        return cache
+
+    def _query(self, value=None, selector="models", attrs: tuple = ()):
+        """
+        Get features with value in selector and all attributes set - memoized, do not modify the result
+        @return: list of features
+        """
+        cache = self._get_cache()
+        key = (value, selector, attrs)
+        if key not in cache["queries"]:
+            features = self.features if self.features is not None else []
+            mask = sum(FLAGS.get(attr, 0) for attr in attrs)
+            other_attrs = [attr for attr in attrs if attr not in FLAGS]
+            indices = range(len(features)) if value is None else self._get_selector_index(selector).get(value, [])
+            cache["queries"][key] = [features[i] for i in indices if cache["masks"][i] & mask == mask and
+                                     all(getattr(features[i], attr, False) for attr in other_attrs)]
+        return cache["queries"][key]
+
+    def _get_selector_index(self, selector="models"):
+        """
+        Get index of list attribute: value -> indices of features containing value
+        @param selector: name of list attribute, e.g. models
+        @return: dict
+        """
+        cache = self._get_cache()
+        if selector not in cache["selectors"]:
+            index = {}
+            for i, feature in enumerate(self.features or []):
+                for value in dict.fromkeys(getattr(feature, selector, None) or []):
+                    index.setdefault(value, []).append(i)
+            cache["selectors"][selector] = index
+        return cache["selectors"][selector]
 
     @staticmethod
     def _get_selected_features_from_file(data, selector="", select_value=""):
         selected_data = data[data[selector] == select_value] if selector != "" else data
         selected_data = selected_data.fillna("")
-        selected_data['Init'] = selected_data['Init'].astype('float')
-        return [Feature(name=row["Name"],
-                        models=row["Predictions"].split(','),
-                        input=row["In_Out"] == 'input',
-                        output=row["In_Out"] == 'output',
-                        parameter=row["In_Out"] == 'parameter',
-                        datatype=row["Type"],
-                        static=row["Stat_Dyn"] == 'static',
-                        dynamic=row["Stat_Dyn"] == "dynamic",
-                        init=row["Init"],
-                        description=row["Description"])
-                for _,row in selected_data.iterrows()]
\ No newline at end of file
+        return FeatureSet._get_features_from_columns({col: selected_data[col].tolist() for col in selected_data.columns})
+
+    @staticmethod
+    def _get_features_from_columns(columns: dict):
+        """
+        Create features from columns of interface file
+        @param columns: dict column name: list of values
+        @return: list of features
+        """
+        inits = [float(init) if init != "" else None for init in columns["Init"]]
+        return [Feature(name=name,
+                        models=models.split(','),
+                        input=in_out == 'input',
+                        output=in_out == 'output',
+                        parameter=in_out == 'parameter',
+                        datatype=datatype,
+                        static=stat_dyn == 'static',
+                        dynamic=stat_dyn == 'dynamic',
+                        init=init,
+                        description=description)
+                for name, in_out, init, stat_dyn, models, datatype, description in
+                zip(columns["Name"], columns["In_Out"], inits, columns["Stat_Dyn"], columns["Predictions"],
+                    columns["Type"], columns["Description"])]
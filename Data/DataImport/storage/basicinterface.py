@@ -1,12 +1,29 @@
 import sys
+import importlib
 
 
 class BasicInterface:
+    # Registry of subclasses: class name -> classes with this name, in order of definition
+    _registry = {}
+    # Declared types for non-subclass lookup: class name -> class or import path "module:attribute"
+    _types = {}
+    # Names not found in imported modules - valid while no further modules are imported
+    _missing = set()
+    _missing_num_modules = 0
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Register subclass by name
+        """
+        super().__init_subclass__(**kwargs)
+        BasicInterface._registry.setdefault(cls.__name__, []).append(cls)
 
     @classmethod
     def cls_from_name(cls, cls_type: str, issubcl=True):
         """
         Get type of class from string (subclass of instance)
+        Non-subclasses are looked up in registered interfaces, declared types (see register_type)
+        and, as fallback, imported modules. Failed searches of imported modules are cached until a module is imported.
         Returns None if non-existent.
         @param cls_type: class name
         @param issubclass: if class is subclass or not
@@ -14,11 +31,32 @@ class BasicInterface:
         """
         if issubcl:
             return cls.subcl_from_name(cls_type)
+        if cls_type in BasicInterface._registry:
+            return BasicInterface._registry[cls_type][-1]
+        target = BasicInterface._types.get(cls_type)
+        if isinstance(target, str):
+            module, _, attr = target.partition(":")
+            target = BasicInterface._types[cls_type] = getattr(importlib.import_module(module), attr or cls_type)
+        if target is not None:
+            return target
+        if BasicInterface._missing_num_modules != len(sys.modules):
+            BasicInterface._missing.clear()
+            BasicInterface._missing_num_modules = len(sys.modules)
+        if cls_type in BasicInterface._missing:
+            return None
+        target = next((getattr(mod, cls_type) for mod in list(sys.modules.values()) if hasattr(mod, cls_type)), None)
+        if target is None:
+            BasicInterface._missing.add(cls_type)
+        return target
 
-        for mod in sys.modules.values():
-            if hasattr(mod, cls_type):
-                return getattr(mod, cls_type)
-        return None
+    @staticmethod
+    def register_type(cls_type: str, target):
+        """
+        Declare type for cls_from_name with issubcl=False
+        @param cls_type: class name
+        @param target: class or import path "module:attribute" - the module is imported on first lookup
+        """
+        BasicInterface._types[cls_type] = target
 
     @classmethod
     def from_name(cls, cls_type: str, issubcl=True, **kwargs):
@@ -29,7 +67,8 @@ class BasicInterface:
         @param issubclass: class is subclass of current class
         @return: instance
         """
-        return cls.cls_from_name(cls_type, issubcl)(**kwargs) if cls.cls_from_name(cls_type, issubcl) is not None else None
+        cls_obj = cls.cls_from_name(cls_type, issubcl)
+        return cls_obj(**kwargs) if cls_obj is not None else None
 
     def _set_attrs(self, **kwargs):
         """
@@ -45,12 +84,13 @@ class BasicInterface:
         return self.__dict__
 
     @classmethod
-    def _get_subclasses(cls, list_subclasses=[]):
+    def _get_subclasses(cls, list_subclasses=None):
         """
         Recursively get subclasses.
         @param list_subclasses: needed for recursion
         @return: list of subclass types
         """
+        list_subclasses = [] if list_subclasses is None else list_subclasses
         for subclass in cls.__subclasses__():
             subclass._get_subclasses(list_subclasses)
             list_subclasses.append(subclass)
@@ -59,14 +99,15 @@ class BasicInterface:
     @classmethod
     def subcl_from_name(cls, cls_type: str):
         """
-        Get type of class from string (subclass of instance)
+        Get type of class from string (subclass of instance) - lookup in registry
         Returns None if non-existent.
         @param cls_type: class name
         @return: class type
         """
         if cls_type == cls.__name__:
             return cls
-        for subcl in cls._get_subclasses():
-            if cls_type == subcl.__name__:
+        # Latest definition first, e.g. after reloading a module
+        for subcl in reversed(BasicInterface._registry.get(cls_type, [])):
+            if issubclass(subcl, cls):
                 return subcl
         return None
\ No newline at end of file
@@ -1,29 +1,155 @@
 import os
+import mmap
 import pickle
+import tempfile
 from . import BasicInterface
 
+# Files with out-of-band buffers start with this header, followed by a pickled envelope
+MAGIC = b"PKLINTF5\n"
+# Buffers in blob file are aligned to this number of bytes
+ALIGNMENT = 64
+
+
+def get_codec(codec: str = None):
+    """
+    Get compression functions - fast compression levels. lz4 and zstd require the lz4 or zstandard package
+    @param codec: zlib, lzma, lz4, zstd or None
+    @return: compress function, decompress function - None if codec is None
+    """
+    if codec is None:
+        return None, None
+    if codec == "zlib":
+        import zlib
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    if codec == "lzma":
+        import lzma
+        return (lambda data: lzma.compress(data, preset=1)), lzma.decompress
+    if codec == "lz4":
+        import lz4.frame
+        return lz4.frame.compress, lz4.frame.decompress
+    if codec == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    raise ValueError(f"Unknown codec {codec}")
+
+
+class _TempFile:
+    """
+    Temporary file in the directory of path, opened for binary writing.
+    Replaces path on successful exit, removed otherwise.
+    """
+    def __init__(self, path):
+        self.path = path
+        fd, self.tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        self.file = os.fdopen(fd, "wb")
+        # mkstemp creates files readable by the owner only - use the permissions of a file created by open
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(self.tmp_path, 0o666 & ~umask)
+
+    def __enter__(self):
+        return self.file
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+
 
 class PickleInterface(BasicInterface):
     """
     Interface for storing objects as pickle file.
+    Optionally, large buffers (e.g. numpy arrays) are stored out-of-band (pickle protocol 5) in a separate
+    blob file <filename>.buffers, which is memory-mapped on load.
     """
     @classmethod
-    def load_pkl(cls, path: str, filename: str):
+    def load_pkl(cls, path: str, filename: str, mmap_buffers=True):
         """
             Load from pickle file.
             @param path: directory containing file
             @param filename: filename
+            @param mmap_buffers: memory-map uncompressed out-of-band buffers (copy on write)
             @return: object from file
         """
         with open(os.path.join(path, filename), "rb") as f:
-            return pickle.load(f)
+            if f.read(len(MAGIC)) != MAGIC:
+                f.seek(0)
+                return pickle.load(f)
+            envelope = pickle.load(f)
+        _, decompress = get_codec(envelope["codec"])
+        data = decompress(envelope["data"]) if decompress is not None else envelope["data"]
+        buffers = cls._read_buffers(os.path.join(path, f"{filename}.buffers"), envelope["buffers"], decompress,
+                                    mmap_buffers)
+        return pickle.loads(data, buffers=buffers)
 
-    def save_pkl(self, path, filename):
+    def save_pkl(self, path, filename, out_of_band=False, codec: str = None):
         """
             Save object to pickle file.
             @param path: directory containing file
             @param filename: filename
+            @param out_of_band: store buffers supporting pickle protocol 5 (e.g. numpy arrays) in separate blob file
+            @param codec: compression of pickle data and buffers: zlib, lzma, lz4, zstd or None.
+            Compressed buffers are not memory-mapped on load.
+        """
+        # Files are written to temporary files and replaced - loaded instances may still map the blob file
+        file_path = os.path.join(path, filename)
+        if not out_of_band and codec is None:
+            with _TempFile(file_path) as f:
+                pickle.dump(self, f)
+            return
+        buffers = []
+        data = pickle.dumps(self, protocol=5, buffer_callback=buffers.append if out_of_band else None)
+        compress, _ = get_codec(codec)
+        positions = []
+        if buffers:
+            with _TempFile(f"{file_path}.buffers") as f:
+                positions = self._write_buffers(f, buffers, compress)
+        elif os.path.exists(f"{file_path}.buffers"):
+            os.remove(f"{file_path}.buffers")
+        envelope = {"codec": codec, "data": compress(data) if compress is not None else data, "buffers": positions}
+        with _TempFile(file_path) as f:
+            f.write(MAGIC)
+            pickle.dump(envelope, f, protocol=5)
+
+    @staticmethod
+    def _write_buffers(f, buffers, compress=None):
+        """
+        Write out-of-band buffers to blob file
+        @param f: blob file opened for binary writing
+        @param buffers: list of pickle.PickleBuffer
+        @param compress: compression function or None
+        @return: list of (offset, size) in blob file
         """
-        with open(os.path.join(path, filename), "wb") as f:
-            pickle.dump(self, f)
+        positions = []
+        for buffer in buffers:
+            raw = buffer.raw()
+            data = compress(raw) if compress is not None else raw
+            offset = -f.tell() % ALIGNMENT
+            f.write(b"\0" * offset)
+            positions.append((f.tell(), len(data)))
+            f.write(data)
+        return positions
 
+    @staticmethod
+    def _read_buffers(path, positions, decompress=None, mmap_buffers=True):
+        """
+        Read out-of-band buffers from blob file
+        @param path: path of blob file
+        @param positions: list of (offset, size)
+        @param decompress: decompression function or None
+        @param mmap_buffers: memory-map uncompressed buffers
+        @return: list of buffers
+        """
+        if not positions:
+            return []
+        with open(path, "rb") as f:
+            if decompress is None and mmap_buffers and os.fstat(f.fileno()).st_size > 0:
+                blob = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+                return [blob[offset:offset + size] for offset, size in positions]
+            blob = f.read()
+        if decompress is None:
+            blob = memoryview(bytearray(blob))
+            return [blob[offset:offset + size] for offset, size in positions]
+        return [bytearray(decompress(blob[offset:offset + size])) for offset, size in positions]
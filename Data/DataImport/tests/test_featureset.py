@@ -0,0 +1,38 @@
+from DataImport.featureset import FeatureSet, Feature
+
+
+def create_feature_set():
+    feature_set = FeatureSet()
+    feature_set.features = [Feature(name="u", models=["y"], input=True, dynamic=True),
+                            Feature(name="d", models=["y"], input=True, static=True),
+                            Feature(name="y", models=["y"], output=True, dynamic=True),
+                            Feature(name="p", models=[""], parameter=True)]
+    return feature_set
+
+
+def test_feature_queries():
+    feature_set = create_feature_set()
+    assert(feature_set.get_dynamic_input_feature_names("y") == ["u"])
+    assert(feature_set.get_static_input_feature_names() == ["d"])
+    assert(feature_set.get_output_feature_names("other") == [])
+    assert(feature_set.get_feature_by_name("p").parameter)
+    # Memoized results are invalidated by add and remove
+    feature_set.add_feature(Feature(name="u2", models=["y"], input=True, dynamic=True))
+    assert(feature_set.get_dynamic_feature_names("y") == ["u", "y", "u2"])
+    feature_set.remove_feature_by_name("u")
+    assert(feature_set.get_dynamic_input_feature_names("y") == ["u2"])
+    assert(feature_set.get_feature_by_name("u") is None)
+
+
+def test_read_interface_file(tmp_path):
+    filename = tmp_path / "interface.csv"
+    filename.write_text("Model;;;;;;\n"
+                        "Name;In_Out;Init;Stat_Dyn;Predictions;Type;Description\n"
+                        "u;input;0;dynamic;y;Real;\n"
+                        "y;output;10;;y,z;Real;output y\n"
+                        "p;parameter;;;;Real;\n")
+    feature_set = FeatureSet(str(filename))
+    assert(feature_set.fmu_type == "Model")
+    assert(feature_set.get_dynamic_input_feature_names("y") == ["u"])
+    assert(feature_set.get_output_feature_names("z") == ["y"])
+    assert(feature_set.get_feature_by_name("y").init == 10 and feature_set.get_feature_by_name("p").init is None)
@@ -1,5 +1,11 @@
 import os
-from DataImport.dataimport import DataImport
+import csv
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.errors import ParserWarning
+from DataImport.dataimport import DataImport, CSVImport, ImportReport, ExcelImport, NpyMemmapImport, TXTImport_Octave, \
+    HDFImport
 
 
 def test_add_extension():
@@ -17,5 +23,248 @@ def test_add_extension():
     assert (fname_new == os.path.join("Data","Data","data.txt"))
 
 
+def create_test_csv(path):
+    # Irregular 7 minute samples with two gaps
+    index = pd.date_range("2020-01-01", periods=3000, freq="7min").delete(np.r_[100:300, 1000:1100])
+    df = pd.DataFrame({"daytime": index.strftime("%d.%m.%Y %H:%M"),
+                       "a": np.arange(index.shape[0], dtype=float),
+                       "b": np.ones(index.shape[0])})
+    df.to_csv(os.path.join(path, "data.csv"), index=False)
+    return os.path.join(path, "data")
+
+
+def test_iter_import(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(freq="15min", index_col="daytime", fill_values=True, cols_to_rename={"a": "A"}, cols_to_drop=["b"])
+    df = data_import.import_data(filename)
+    df_chunks = pd.concat(data_import.iter_import(filename, chunksize=137))
+    assert(df.columns.tolist() == ["A"])
+    pd.testing.assert_frame_equal(df, df_chunks, check_freq=False)
+
+
+def test_hdf_iter_import(tmp_path):
+    # Gap after row 601, then samples switching to :30 seconds
+    index = pd.date_range("2020-01-01", periods=601, freq="min").append(
+        pd.date_range("2020-01-01 13:05", periods=600, freq="min")).append(
+        pd.date_range("2020-01-02 00:00:30", periods=1500, freq="min"))
+    df = pd.DataFrame({"a": np.arange(index.shape[0], dtype=float)}, index=pd.Index(index, name="t"))
+    df.loc[df.index[::7], "a"] = np.nan
+    df.to_hdf(os.path.join(tmp_path, "data.hd5"), key="df", format="table", mode="w")
+    data_import = HDFImport(freq="15min", index_col="t", fill_values=True)
+    df_imported = data_import.import_data(os.path.join(tmp_path, "data"))
+    expected = df.reindex(pd.date_range(index[0], index[-1], freq="min")).resample("15min").first()
+    expected = expected.groupby(expected.index.time).ffill()
+    assert(df_imported.index.equals(expected.index))
+    assert(np.allclose(df_imported["a"], expected["a"], equal_nan=True))
+    for chunksize in [601, 605, 100]:
+        df_chunks = pd.concat(data_import.iter_import(os.path.join(tmp_path, "data"), chunksize=chunksize))
+        pd.testing.assert_frame_equal(df_imported, df_chunks, check_freq=False)
+
+
+def test_import_cached(tmp_path):
+    filename = create_test_csv(tmp_path)
+    cache_dir = os.path.join(tmp_path, "cache")
+    data_import = CSVImport(freq="15min", index_col="daytime", fill_values=True, cache_dir=cache_dir)
+    df = data_import.import_data(filename)
+    assert(len(os.listdir(cache_dir)) > 0)
+    pd.testing.assert_frame_equal(df, data_import.import_data(filename), check_freq=False)
+    # Changed configuration invalidates cache
+    data_import.cols_to_drop = ["b"]
+    assert(data_import.import_data(filename).columns.tolist() == ["a"])
+    assert(len([file for file in os.listdir(cache_dir) if file.endswith(".json")]) == 1)
+    # File with the same name in another directory does not remove the entry
+    os.makedirs(os.path.join(tmp_path, "other"))
+    other_filename = create_test_csv(os.path.join(tmp_path, "other"))
+    data_import.import_data(other_filename)
+    assert(len([file for file in os.listdir(cache_dir) if file.endswith(".json")]) == 2)
+
+
+def test_to_datetime():
+    expected = pd.DatetimeIndex(["2020-02-01 10:00", "NaT", "2020-02-01 10:00", "2020-02-01 10:15"])
+    for fmt in ["infer", "%d.%m.%Y %H:%M"]:
+        data_import = DataImport(datetime_fmt=fmt)
+        datetime = data_import.to_datetime(["01.02.2020 10:00", None, "01.02.2020 10:00", "01.02.2020 10:15"])
+        assert(datetime.equals(expected))
+    # Epoch timestamps - seconds and milliseconds
+    seconds = np.array([1580551200, 1580552100])
+    datetime = DataImport(datetime_fmt="posix").to_datetime(seconds)
+    assert(datetime.equals(DataImport(datetime_fmt="posix_ms").to_datetime(seconds * 1000)))
+
+
+def test_npy_memmap_import(tmp_path):
+    df = CSVImport(freq="15min", index_col="daytime", fill_values=True).import_data(create_test_csv(tmp_path))
+    NpyMemmapImport().data_to_file(df, os.path.join(tmp_path, "data"))
+    # Select importer from JSON configuration
+    NpyMemmapImport(index_col="daytime").to_file(os.path.join(tmp_path, "config"))
+    data_import = DataImport.load(os.path.join(tmp_path, "config.json"))
+    assert(isinstance(data_import, NpyMemmapImport))
+    df_npy = data_import.import_data(os.path.join(tmp_path, "data.npy"))
+    pd.testing.assert_frame_equal(df, df_npy, check_freq=False)
+
+
+def test_set_dtypes():
+    data_import = DataImport(float_dtype="float32", compact_ints=True)
+    df = pd.DataFrame({"a": [1.0, 2.0, 300.0], "b": [0.0, 1.0, 1.0], "c": [1, 2, 3], "d": [0.5, 1.0, 2.0], "e": [1.0, np.nan, 2.0]})
+    df = data_import.set_dtypes(df, {"a": "Int", "b": "Bool", "e": "Int"})
+    assert(df.dtypes.tolist() == [np.int16, bool, np.int8, np.float32, np.float32])
+
+
+def test_import_many(tmp_path):
+    index = pd.date_range("2020-01-01", periods=96 * 10, freq="15min")
+    df = pd.DataFrame({"daytime": index.strftime("%d.%m.%Y %H:%M"), "a": np.arange(index.shape[0], dtype=float)})
+    # Overlapping daily files in reverse order, one day missing
+    filenames = []
+    for day in range(10):
+        filenames.insert(0, os.path.join(tmp_path, f"day_{day}"))
+        if day != 5:
+            df.iloc[max(day * 96 - 4, 0):(day + 1) * 96].to_csv(f"{filenames[0]}.csv", index=False)
+    filenames.remove(os.path.join(tmp_path, "day_5"))
+    data_import = CSVImport(freq="15min", index_col="daytime", fill_values=True)
+    df_merged = data_import.import_many(filenames, workers=2)
+    assert(df_merged.index.equals(pd.DatetimeIndex(index)))
+    assert(df_merged["a"].isna().sum() == 96 - 4)
+
+
+def test_import_many_off_grid(tmp_path):
+    filename = create_test_csv(tmp_path)
+    df_file = pd.read_csv(f"{filename}.csv")
+    # File boundary between two samples that are not on the 15 minute grid
+    df_file.iloc[:1507].to_csv(os.path.join(tmp_path, "part_0.csv"), index=False)
+    df_file.iloc[1507:].to_csv(os.path.join(tmp_path, "part_1.csv"), index=False)
+    data_import = CSVImport(freq="15min", index_col="daytime", datetime_fmt="%d.%m.%Y %H:%M", fill_values=True)
+    df_merged = data_import.import_many([os.path.join(tmp_path, f"part_{i}") for i in range(2)])
+    pd.testing.assert_frame_equal(df_merged, data_import.import_data(filename), check_freq=False)
+
+
+def test_import_columns(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(freq="15min", index_col="daytime", cols_to_rename={"a": "A"})
+    assert(data_import.get_usecols(["A", "c"]) == ["a", "c", "daytime"])
+    df = data_import.import_data(filename, columns=["A", "c"])
+    assert(df.columns.tolist() == ["A"])
+    assert(df.index.name == "daytime")
+
+
+def test_import_window(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(freq="15min", index_col="daytime", datetime_fmt="%d.%m.%Y %H:%M")
+    df = data_import.import_data(filename)
+    start, stop = pd.Timestamp("2020-01-03 07:00"), pd.Timestamp("2020-01-05 12:00")
+    df_window = data_import.import_data(filename, start=start, stop=stop)
+    pd.testing.assert_frame_equal(df_window, df.loc[start:stop])
+    assert(data_import.import_data(filename, stop="2019-12-31").empty)
+
+
+def test_import_window_quoted(tmp_path):
+    filename = create_test_csv(tmp_path)
+    df_file = pd.read_csv(f"{filename}.csv")
+    df_file.to_csv(f"{filename}.csv", index=False, quoting=csv.QUOTE_ALL)
+    start, stop = pd.Timestamp("2020-01-03 07:00"), pd.Timestamp("2020-01-05 12:00")
+    data_import = CSVImport(freq="15min", index_col="daytime", datetime_fmt="%d.%m.%Y %H:%M", fill_values=True)
+    df_window = data_import.import_data(filename, start=start, stop=stop)
+    assert(df_window.index[0] == start and df_window.index[-1] <= stop)
+    pd.testing.assert_frame_equal(pd.concat(data_import.iter_import(filename, chunksize=500, start=start, stop=stop)),
+                                  df_window, check_freq=False)
+    pd.testing.assert_frame_equal(data_import.import_many([filename], start=start, stop=stop), df_window,
+                                  check_freq=False)
+    # Regular expression separator: window is selected after parsing
+    df_file.to_csv(f"{filename}.csv", index=False)
+    data_import.sep = "[,]"
+    with pytest.warns(ParserWarning):
+        pd.testing.assert_frame_equal(data_import.import_data(filename, start=start, stop=stop), df_window)
+
+
+def test_import_incremental(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(freq="15min", index_col="daytime", fill_values=True)
+    df = data_import.import_data(filename)
+    with open(f"{filename}.csv", "rb") as f:
+        lines = f.readlines()
+    with open(f"{filename}.csv", "wb") as f:
+        f.writelines(lines[:1500])
+    df_incremental = data_import.import_incremental(filename)
+    with open(f"{filename}.csv", "ab") as f:
+        f.writelines(lines[1500:])
+    df_incremental = data_import.import_incremental(filename)
+    pd.testing.assert_frame_equal(df, df_incremental, check_freq=False)
+    assert(data_import.import_incremental(filename) is df_incremental)
+    assert("_incremental_state" not in data_import._get_attrs())
+
+
+def test_import_incremental_persisted(tmp_path):
+    index = pd.date_range("2020-01-01", periods=3000, freq="min").delete(np.r_[700:900])
+    df = pd.DataFrame({"a": np.arange(index.shape[0], dtype=float)}, index=pd.Index(index, name="t"))
+    filename = os.path.join(tmp_path, "data")
+    args = dict(freq="15min", index_col="t", fill_values=True, cache_dir=os.path.join(tmp_path, "cache"))
+    df.to_hdf(f"{filename}.hd5", key="df", format="table", mode="w")
+    expected = HDFImport(freq="15min", index_col="t", fill_values=True).import_data(filename)
+    df.iloc[:1007].to_hdf(f"{filename}.hd5", key="df", format="table", mode="w")
+    # Last interval is returned and replaced by the next call
+    df_incremental = HDFImport(**args).import_incremental(filename)
+    pd.testing.assert_frame_equal(df_incremental, expected.loc[:df_incremental.index[-1]], check_freq=False)
+    df.iloc[1007:].to_hdf(f"{filename}.hd5", key="df", format="table", append=True)
+    # State is loaded from cache_dir
+    pd.testing.assert_frame_equal(HDFImport(**args).import_incremental(filename), expected, check_freq=False)
+    # Replaced file is imported completely
+    df.iloc[:500].to_hdf(f"{filename}_new.hd5", key="df", format="table", mode="w")
+    os.replace(f"{filename}_new.hd5", f"{filename}.hd5")
+    assert(HDFImport(**args).import_incremental(filename).index[-1] == df.index[499].floor("15min"))
+
+
+def test_excel_import_convert(tmp_path):
+    filename = os.path.join(tmp_path, "data")
+    index = pd.date_range("2020-01-01", periods=200, freq="15min")
+    df = pd.DataFrame({"daytime": index, "a": np.arange(200, dtype=float), "b": np.ones(200)})
+    with pd.ExcelWriter(f"{filename}.xlsx") as writer:
+        df.iloc[:120].to_excel(writer, sheet_name="1", index=False)
+        df.iloc[120:].to_excel(writer, sheet_name="2", index=False)
+    data_import = ExcelImport(sheets="all", workers=2, convert=True, freq="15min", index_col="daytime")
+    df_ref = ExcelImport(sheets="all", freq="15min", index_col="daytime").import_data(filename)
+    df_converted = data_import.import_data(filename, columns=["a"])
+    assert(any(file.startswith("data.xlsx_") for file in os.listdir(tmp_path)))
+    pd.testing.assert_frame_equal(df_ref[["a"]], df_converted)
+    pd.testing.assert_frame_equal(df_ref, data_import.import_data(filename))
+
+
+def test_octave_parallel_import(tmp_path):
+    with open(os.path.join(tmp_path, "header.head"), "w") as f:
+        f.write("# header\n" * 5 + "\t".join(["time", "a", "b"]))
+    values = np.column_stack([np.arange(0, 3600, 60), np.random.rand(60), np.random.rand(60)])
+    np.savetxt(os.path.join(tmp_path, "data.txt"), values, delimiter=" ")
+    filename = os.path.join(tmp_path, "data")
+    args = dict(octave_header_file="header", freq="1min", index_col="time", index_type="timedelta", unit="s")
+    df = TXTImport_Octave(**args).import_data(filename, columns=["b"])
+    df_parallel = TXTImport_Octave(workers=2, **args).import_data(filename, columns=["b"])
+    pd.testing.assert_frame_equal(df, df_parallel)
+    with open(os.path.join(tmp_path, "data.txt"), "a") as f:
+        f.write("3600 1\n")
+    assert(TXTImport_Octave(workers=2, **args).read_file(filename)["b"].isna().sum() == 1)
+
+
+def test_import_report(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(freq="15min", index_col="daytime", fill_values=True, cols_to_drop=["b"])
+    report = ImportReport(trace_memory=True)
+    df = data_import.import_data(filename, report=report)
+    stages = {stage.name: stage for stage in report.stages}
+    assert(list(stages) == ["read_file", "select_columns", "set_index", "select_window", "fill_missing_vals",
+                            "rename_columns", "drop_columns", "set_dtypes"])
+    assert(stages["read_file"].rows_out == 2700 and stages["set_dtypes"].rows_out == df.shape[0])
+    assert(all(stage.tracemalloc_peak is not None for stage in report.stages))
+    assert(report.to_dict()["wall_time"] == report.wall_time)
+    report = ImportReport()
+    data_import.import_data(filename, report=report)
+    assert(all(stage.tracemalloc_peak is None for stage in report.stages))
+
+
+def test_fused_pipeline(tmp_path):
+    filename = create_test_csv(tmp_path)
+    data_import = CSVImport(index_col="daytime", cols_to_rename={"a": "A", "b": "B"}, cols_to_drop=["B"])
+    df_read = data_import.read_file(filename)
+    assert(df_read.index.name == "daytime" and df_read.columns.tolist() == ["a"])
+    df = data_import.import_data(filename)
+    assert(df.columns.tolist() == ["A"] and df.index.dtype.kind == "M")
+
+
 if __name__ == '__main__':
-    test_add_extension()
\ No newline at end of file
+    test_add_extension()
@@ -0,0 +1,75 @@
+import os
+import sys
+import types
+from collections import OrderedDict
+import numpy as np
+from DataImport.storage import JSONInterface, PickleInterface
+from DataImport.dataimport import DataImport, CSVImport
+from DataImport.featureset import FeatureSet
+
+
+def test_subclass_from_name():
+    data_import = DataImport.from_json({"Type": "CSVImport", "Parameters": {"sep": ";"}})
+    assert(isinstance(data_import, CSVImport) and data_import.sep == ";")
+    assert(DataImport.subcl_from_name("DataImport") is DataImport)
+    assert(CSVImport.subcl_from_name("HDFImport") is None)
+    assert(JSONInterface.subcl_from_name("Unknown") is None)
+    assert(len(DataImport._get_subclasses()) == len(DataImport._get_subclasses()))
+
+
+def test_cls_from_name_declared_type():
+    JSONInterface.register_type("OrderedDictType", "collections:OrderedDict")
+    assert(JSONInterface.cls_from_name("OrderedDictType", issubcl=False) is OrderedDict)
+    assert(JSONInterface.cls_from_name("CSVImport", issubcl=False) is CSVImport)
+    assert(isinstance(JSONInterface.from_name("CSVImport", issubcl=False), CSVImport))
+    assert(JSONInterface.cls_from_name("FeatureSet", issubcl=False) is FeatureSet)
+
+
+def test_cls_from_name_missing_cached():
+    assert(JSONInterface.cls_from_name("LateType", issubcl=False) is None)
+    assert("LateType" in JSONInterface._missing)
+    # Types of modules imported after a failed lookup are found
+    module = types.ModuleType("late_module")
+    module.LateType = OrderedDict
+    sys.modules["late_module"] = module
+    try:
+        assert(JSONInterface.cls_from_name("LateType", issubcl=False) is OrderedDict)
+    finally:
+        del sys.modules["late_module"]
+    # Registered interfaces are found before other types with the same name
+    JSONInterface.register_type("LateSubclass", OrderedDict)
+
+    class LateSubclass(JSONInterface):
+        pass
+    assert(JSONInterface.cls_from_name("LateSubclass", issubcl=False) is LateSubclass)
+
+
+class WeightsModel(PickleInterface):
+    def __init__(self, weights=None):
+        self.weights = weights
+
+
+def test_pickle_out_of_band(tmp_path):
+    model = WeightsModel([np.random.rand(1000, 10), np.arange(7), np.zeros(0)])
+    for codec in [None, "zlib"]:
+        model.save_pkl(tmp_path, f"model_{codec}.pkl", out_of_band=True, codec=codec)
+        loaded = WeightsModel.load_pkl(tmp_path, f"model_{codec}.pkl")
+        assert(all(np.array_equal(w, w_loaded) for w, w_loaded in zip(model.weights, loaded.weights)))
+        loaded.weights[0][0, 0] = -1
+    assert(os.path.getsize(os.path.join(tmp_path, "model_None.pkl.buffers")) >= model.weights[0].nbytes)
+    model.save_pkl(tmp_path, "model.pkl")
+    assert(np.array_equal(WeightsModel.load_pkl(tmp_path, "model.pkl").weights[1], model.weights[1]))
+
+
+def test_pickle_save_while_loaded(tmp_path):
+    model = WeightsModel([np.random.rand(1000, 100)])
+    model.save_pkl(tmp_path, "model.pkl", out_of_band=True)
+    loaded = WeightsModel.load_pkl(tmp_path, "model.pkl")
+    # Saving again must not modify the blob file mapped by the loaded instance
+    WeightsModel([np.zeros(1)]).save_pkl(tmp_path, "model.pkl", out_of_band=True)
+    assert(np.array_equal(loaded.weights[0], model.weights[0]))
+    assert(np.array_equal(WeightsModel.load_pkl(tmp_path, "model.pkl").weights[0], np.zeros(1)))
+    WeightsModel([]).save_pkl(tmp_path, "model.pkl", out_of_band=True)
+    assert(not os.path.exists(os.path.join(tmp_path, "model.pkl.buffers")))
+    assert(np.array_equal(loaded.weights[0], model.weights[0]))
+    assert(sorted(os.listdir(tmp_path)) == ["model.pkl"])
@@ -44,7 +44,8 @@ class FMUGenerator:
         fmu_path.unlink(missing_ok=True)
         # Generate tree, adapt files
         self._generate_FMU_tree(FMU_directory)
-        copy_tree(self.fmu_src_dir, str(FMU_directory / "resources"))
+        # Sources may be read-only links into an artifact store - copies are writable, so the tree can be removed
+        copy_tree(self.fmu_src_dir, str(FMU_directory / "resources"), preserve_mode=0)
         xml_parser = FMUXMLParser(str(FMU_directory / "modelDescription.xml"))
         xml_parser.exportxml(self.fmu_interface)
         # Compress directory and rename
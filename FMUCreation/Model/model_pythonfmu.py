@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import numpy as np
 
 from featureset import FeatureSet
 import model_utils as fc
@@ -7,7 +8,7 @@ from pythonfmu import Fmi2Causality, Fmi2Variability, Fmi2Slave
 import pythonfmu.variables
 import matplotlib.pyplot as plt
 import datamodels
-from collections import deque
+from operator import attrgetter
 from parameters import TrainingParams
 #from feature_engineering.expandedmodel import ExpandedModel
 
@@ -31,10 +32,14 @@ class Model(Fmi2Slave):
 
         # Lookback Horizon - Assume all models have same lookback horizon
         num_lookback_states = self.models[0]["training_params"].lookback_horizon + 1
-        # Create queues
-        dict_queues = {fc.que_name(feature.name): deque([fc.cast(feature.init, feature.datatype)] * num_lookback_states,
-                                                        maxlen=num_lookback_states) for feature in self.feature_set.get_dynamic_feats()}
-        self._set_attrs(dict_queues)
+        # State vector: static inputs of each model, followed by lookback buffer for dynamic features
+        num_static = sum(len(model["training_params"].static_input_features) for model in self.models)
+        dynamic_feature_names = self.feature_set.get_dynamic_feature_names()
+        self._state = np.zeros(num_static + len(dynamic_feature_names) * 2 * num_lookback_states)
+        self.lookback = fc.LookbackBuffer(dynamic_feature_names, num_lookback_states,
+                                          {feature.name: fc.cast(feature.init, feature.datatype) for feature in self.feature_set.get_dynamic_feats()},
+                                          self._state[num_static:].reshape(len(dynamic_feature_names), 2 * num_lookback_states))
+        self._create_input_plans()
 
         # Feature initializations
         [self._set_output_value(feature.name, fc.cast(feature.init, feature.datatype)) for feature in feature_set.features]
@@ -61,31 +66,42 @@ class Model(Fmi2Slave):
     def _init_start_vals_from_params(self):
         # Set output values based on start params
         self._set_attrs(self._get_start_params(self.feature_set.get_output_feats()))
-        # Init queues for dynamic features
-        dict_queues = self._get_attributes([fc.que_name(name) for name in self.feature_set.get_dynamic_feature_names()])
-        queues_updated = fc.init_queues(dict_queues, self._get_start_params(self.feature_set.get_dynamic_feats()))
-        self._set_attrs(queues_updated)
+        # Lookback states of dynamic features keep their initial values (feature init)
 
     def _update_outputs(self):
         # Predictions
+        state = self._state
         for model in self.models:
-            predicted_values = model["model"].predict(self._get_model_input(model["training_params"]))[0]
+            if model["get_static_values"] is not None:
+                state[model["static_slice"]] = model["get_static_values"](self)
+            predicted_values = model["model"].predict(self._get_model_input(model))[0]
             for feature, value in zip(model["training_params"].target_features, predicted_values):
                 self._set_output_value(feature, value)
-        # Dynamic fetures: update queues
-        for feature in self.feature_set.get_dynamic_feature_names():
-            self._update_queue(feature, getattr(self, feature))
-
-    def _get_model_input(self, training_parameters):
-        # Static features
-        dict_static_features = self._get_attributes(training_parameters.static_input_features)
-        static_features = fc.create_static_feature_vector(dict_static_features)
-        # Dynamic features
-        dict_queues = self._get_attributes([fc.que_name(name) for name in training_parameters.dynamic_input_features])
-        dynamic_features = fc.create_dynamic_feature_vector(training_parameters.dynamic_input_features, dict_queues,
-                                                            training_parameters.lookback_horizon + 1)
-        # Combine both
-        return fc.combine_static_and_dynamic_features(static_features, dynamic_features)
+        # Dynamic features: update lookback buffer
+        if self._get_dynamic_values is not None:
+            self.lookback.append(self._get_dynamic_values(self))
+
+    def _create_input_plans(self):
+        # Input assembly plan for each model: slots of static inputs in state vector, index table into state vector
+        # for each lookback buffer position and preallocated input array
+        dynamic_feature_names = self.feature_set.get_dynamic_feature_names()
+        self._get_dynamic_values = attrgetter(*dynamic_feature_names) if dynamic_feature_names else None
+        num_static = self._state.size - self.lookback.data.size
+        start = 0
+        for model in self.models:
+            static_names = model["training_params"].static_input_features
+            model["static_slice"] = slice(start, start + len(static_names))
+            model["get_static_values"] = attrgetter(*static_names) if static_names else None
+            lookback_index = self.lookback.create_index(model["training_params"].dynamic_input_features, num_static)
+            model["input_index"] = fc.create_input_index(np.arange(start, start + len(static_names)), lookback_index)
+            model["input"] = np.zeros((1, 1, model["input_index"].shape[1]))
+            model["input_flat"] = model["input"].reshape(-1)
+            start += len(static_names)
+
+    def _get_model_input(self, model):
+        # Gather static inputs and lookback window from state vector
+        np.take(self._state, model["input_index"][self.lookback.pos], out=model["input_flat"])
+        return model["input"]
 
 
     def _set_output_value(self, name, value):
@@ -97,15 +113,6 @@ class Model(Fmi2Slave):
     def _get_start_params(self, output_features):
         return {feature.name: fc.cast(getattr(self, f"{feature.name}_start", 0), feature.datatype) for feature in output_features}
 
-    def _get_attributes(self, feature_names):
-        return {name: getattr(self, name) for name in feature_names}
-
-    def _update_queue(self, feature, value):
-        queue = getattr(self, fc.que_name(feature), None)
-        if queue:
-            queue.append(value)
-            self._set_output_value(fc.que_name(feature), queue)
-
     def do_step(self, current_time: float, step_size: float):
         self._update_outputs()
         return True
@@ -21,6 +21,76 @@ def que_name(feature_name):
     return f"{feature_name}_queue"
 
 
+class LookbackBuffer:
+    """
+    Preallocated ring buffer for lookback states of dynamic features.
+    Shape: number of features, 2 * lookback length. Each value is written twice (at pos and pos + length),
+    so the window of the last states is always the contiguous slice [pos:pos + length], oldest state first.
+    """
+    feature_names: list = None
+    length: int = 1
+    rows: dict = None
+    data: np.ndarray = None
+    pos: int = 0
+
+    def __init__(self, feature_names, length=1, init_vals=None, data=None):
+        """
+        @param feature_names: names of dynamic features - one row per feature
+        @param length: number of lookback states (lookback horizon + 1)
+        @param init_vals: dict feature name: initial value
+        @param data: preallocated contiguous storage of shape (number of features, 2 * length),
+        e.g. a view of a state vector - default: new array
+        """
+        self.feature_names = list(feature_names)
+        self.length = length
+        self.rows = {name: row for row, name in enumerate(self.feature_names)}
+        self.data = np.zeros((len(self.feature_names), 2 * length)) if data is None else data
+        self.pos = 0
+        if init_vals is not None:
+            self.init(init_vals)
+
+    def init(self, init_vals: dict):
+        """
+        Fill lookback states of features with value
+        @param init_vals: dict feature name: value
+        """
+        for name, val in init_vals.items():
+            if name in self.rows:
+                self.data[self.rows[name]] = val
+
+    def append(self, values):
+        """
+        Add state for all features - oldest state is overwritten
+        @param values: sequence of values in order of feature_names
+        """
+        self.data[:, self.pos] = values
+        self.data[:, self.pos + self.length] = values
+        self.pos = (self.pos + 1) % self.length
+
+    def create_index(self, feature_names, offset=0):
+        """
+        Create index table to gather the lookback states of selected features for each buffer position
+        @param feature_names: selected features
+        @param offset: position of buffer in state vector
+        @return: np.array shape: length, number of selected features * length - flat indices into buffer
+        """
+        rows = np.array([self.rows[name] for name in feature_names], dtype=np.intp)
+        cols = np.arange(self.length, dtype=np.intp)
+        base = (rows[:, None] * 2 * self.length + cols[None, :]).reshape(-1) + offset
+        return base[None, :] + np.arange(self.length, dtype=np.intp)[:, None]
+
+
+def create_input_index(static_index: np.ndarray, lookback_index: np.ndarray):
+    """
+    Create index table of model input for each lookback buffer position - static features first
+    @param static_index: positions of static features in state vector
+    @param lookback_index: index table from LookbackBuffer.create_index
+    @return: np.array shape: lookback length, number of static features + number of lookback states
+    """
+    static_index = np.broadcast_to(np.asarray(static_index, dtype=np.intp), (lookback_index.shape[0], len(static_index)))
+    return np.hstack([static_index, lookback_index])
+
+
 def create_dynamic_feature_vector(dynamic_feature_names, dict_queues, queue_len=5):
     """
     DYNAMIC FEATURES
@@ -33,7 +33,11 @@ if __name__ == "__main__":
     model_file = "model.py" if used_framework == "unifmu" else "model_pythonfmu.py"
     file_paths.src_files[f'model.py'] = os.path.join('FMUCreation', 'Model', model_file)
     # Move sources to FMUSources dir
-    file_utils.move_model(file_paths, fmu_src_path)
+    store = file_utils.get_artifact_store(file_paths)
+    manifest = file_utils.move_model(file_paths, fmu_src_path, store)
+    if store is not None:
+        os.makedirs(root_dir, exist_ok=True)
+        store.write_manifest(manifest, os.path.join(root_dir, f"{fmu_name}_sources_manifest.json"))
 
     if used_framework == 'pythonfmu':
         sources = " ".join([path for path in list(file_paths.src_files.keys()) + [os.path.split(dir)[-1] for dir in
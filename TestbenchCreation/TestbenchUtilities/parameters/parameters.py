@@ -1,9 +1,19 @@
+import os
 import dataclasses
 import json
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 @dataclass
 class Parameters:
+    # Registry of subclasses: class name -> classes with this name, in order of definition
+    _registry = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Parameters._registry.setdefault(cls.__name__, []).append(cls)
+
     def __init__(self, **kwargs):
         pass
 
@@ -21,18 +31,24 @@ class Parameters:
 
     @classmethod
     def from_json(cls, dict_file):
-        for subclass in cls._get_subclasses():
-            if dict_file["Type"] in str(subclass):
-                return subclass(**(dict_file["Parameters"]))
-        return cls(**(dict_file["Parameters"]))
+        subclass = cls._subclass_from_name(dict_file["Type"])
+        return (subclass or cls)(**(dict_file["Parameters"]))
 
     @classmethod
-    def _get_subclasses(cls, list_subclasses=[]):
+    def _get_subclasses(cls, list_subclasses=None):
+        list_subclasses = [] if list_subclasses is None else list_subclasses
         for subclass in cls.__subclasses__():
             subclass._get_subclasses(list_subclasses)
             list_subclasses.append(subclass)
         return list_subclasses
 
+    @classmethod
+    def _subclass_from_name(cls, name: str):
+        for subclass in reversed(Parameters._registry.get(name, [])):
+            if issubclass(subclass, cls) and subclass is not cls:
+                return subclass
+        return None
+
     @classmethod
     def load(cls, filename="testbench_params.json"):
         with open(filename, "r") as f:
@@ -51,3 +67,108 @@ class Parameters:
             sim_param_list = [cls.from_json(dict) for dict in list_dicts]
             return sim_param_list
 
+    @staticmethod
+    def store_parameters_lines(parameters_list, path_full):
+        index = array("Q")
+        with open(path_full, "wb") as f:
+            for params in parameters_list:
+                index.append(f.tell())
+                f.write(params.to_json().encode() + b"\n")
+            size = f.tell()
+        ParametersLines.write_index(path_full, size, index)
+
+    @staticmethod
+    def append_parameters_line(params, path_full):
+        size = os.path.getsize(path_full) if os.path.exists(path_full) else 0
+        if size > 0 and ParametersLines.read_indexed_size(path_full) != size:
+            size = ParametersLines(path_full).size
+        with open(path_full, "ab") as f:
+            f.truncate(size)
+            f.write(params.to_json().encode() + b"\n")
+            new_size = f.tell()
+        if size == 0:
+            ParametersLines.write_index(path_full, new_size, array("Q", [0]))
+            return
+        # Offset is written before the indexed size - an interrupted update invalidates the index
+        with open(f"{path_full}.idx", "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            array("Q", [size]).tofile(f)
+            f.seek(0)
+            array("Q", [new_size]).tofile(f)
+
+    @classmethod
+    def load_parameters_lines(cls, path_full):
+        return ParametersLines(path_full, cls)
+
+
+class ParametersLines(Sequence):
+    def __init__(self, path_full, cls=Parameters):
+        self.path_full = path_full
+        self.cls = cls
+        self.size = 0
+        self.index = self._read_index()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        with open(self.path_full, "rb") as f:
+            f.seek(self.index[position])
+            return self.cls.from_json(json.loads(f.readline()))
+
+    def __iter__(self):
+        with open(self.path_full, "rb") as f:
+            for line in f:
+                if line.endswith(b"\n") and line.strip():
+                    yield self.cls.from_json(json.loads(line))
+
+    @staticmethod
+    def read_indexed_size(path_full):
+        index_path = f"{path_full}.idx"
+        if not os.path.exists(index_path) or os.path.getsize(index_path) < 8:
+            return None
+        with open(index_path, "rb") as f:
+            return array("Q", f.read(8))[0]
+
+    @staticmethod
+    def write_index(path_full, size, index):
+        with open(f"{path_full}.idx", "wb") as f:
+            array("Q", [size]).tofile(f)
+            index.tofile(f)
+
+    def _read_index(self):
+        index = array("Q")
+        index_path = f"{self.path_full}.idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                data = f.read()
+            index.frombytes(data[:len(data) // index.itemsize * index.itemsize])
+        size = index.pop(0) if index else 0
+        with open(self.path_full, "rb") as f:
+            if not self._is_valid(f, size, index):
+                index, size = array("Q"), 0
+            indexed_size = size
+            f.seek(size)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    index.append(size)
+                size += len(line)
+        self.size = size
+        if size != indexed_size or not os.path.exists(index_path):
+            self.write_index(self.path_full, size, index)
+        return index
+
+    @staticmethod
+    def _is_valid(f, size, index):
+        if size > os.fstat(f.fileno()).st_size or (index and index[-1] >= size):
+            return False
+        for offset in [size, index[-1] if index else 0]:
+            if offset > 0:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    return False
+        return True
@@ -0,0 +1,32 @@
+import os
+from TestbenchCreation.TestbenchUtilities.parameters import Parameters, SimulationParameters, DymolaModelParameters
+
+
+def test_simulation_parameters_lines(tmp_path):
+    path = str(tmp_path / "simulations.jsonl")
+    sim_params = SimulationParameters.create_params(4, start_time=0, start_duration=3600, experiment_duration=7200)
+    Parameters.store_parameters_lines(sim_params, path)
+    lines = SimulationParameters.load_parameters_lines(path)
+    assert(len(lines) == 5 and lines[2] == sim_params[2] and isinstance(lines[0], SimulationParameters))
+    assert([params.stop_time for params in lines[3:]] == [25200, 32400])
+    # Model parameters in the same file
+    model_params = DymolaModelParameters(model_name="Pkg.Model", inputs={"T_in": "T"}, outputs=["T_out"])
+    Parameters.append_parameters_line(model_params, path)
+    lines = Parameters.load_parameters_lines(path)
+    assert(len(lines) == 6 and lines[-1] == model_params and lines[-1].get_input_names() == ["T_in"])
+    # Partially written experiment is not indexed and removed on append
+    with open(path, "a") as f:
+        f.write('{"Type": "SimulationParameters", "Parameters": {"start_t')
+    assert(len(Parameters.load_parameters_lines(path)) == 6)
+    next_params = SimulationParameters(start_time=32400, stop_time=39600, num_intervals=8, output_interval=900)
+    Parameters.append_parameters_line(next_params, path)
+    lines = Parameters.load_parameters_lines(path)
+    assert(len(lines) == 7 and lines[-1] == next_params and list(lines)[-2] == model_params)
+    # Rewritten file invalidates index
+    with open(path, "w") as f:
+        f.write(sim_params[0].to_json() + "\n")
+    lines = Parameters.load_parameters_lines(path)
+    assert(len(lines) == 1 and lines[0] == sim_params[0])
+    os.remove(path)
+    Parameters.append_parameters_line(model_params, path)
+    assert(Parameters.load_parameters_lines(path)[0] == model_params)
@@ -13,4 +13,5 @@ class FMU_src_paths(Parameters):
     resource_root: str = ""
     src_root: str = ""
     resource_dst: str = "models"
+    artifact_store: str = None
 
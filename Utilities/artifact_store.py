@@ -0,0 +1,167 @@
+import os
+import sys
+import stat
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Directories that are not added to the store
+IGNORE_DIRS = {"__pycache__"}
+
+
+def remove_file(path):
+    """
+    Remove file - read-only files (e.g. links to blobs on Windows) are made writable first
+    @param path: path to file
+    """
+    try:
+        os.unlink(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+        os.unlink(path)
+
+
+def remove_tree(path):
+    """
+    Remove directory tree including read-only files - no error if the directory does not exist
+    @param path: path to directory
+    """
+    def _remove_readonly(func, failed_path, _):
+        os.chmod(failed_path, stat.S_IWRITE | stat.S_IREAD)
+        func(failed_path)
+
+    if os.path.isdir(path):
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=_remove_readonly)
+        else:
+            shutil.rmtree(path, onerror=_remove_readonly)
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for model artifacts and FMU sources.
+    Files are stored once under <root>/blobs/<hash[:2]>/<hash>, keyed by the SHA-256 of their content.
+    Directories reference blobs through hardlinks - files are copied if hardlinks are not supported.
+    Blobs are read-only, so staged files must be replaced instead of modified in place - writing to a staged file
+    fails instead of changing the blob. Use remove_file/remove_tree to delete staged files.
+    """
+    root: Path = None
+
+    def __init__(self, root="artifact_store"):
+        """
+        @param root: root directory of store
+        """
+        self.root = Path(root)
+        self._digests = {}
+
+    def hash_file(self, path):
+        """
+        Get SHA-256 of file content - cached by path, size and modification time
+        @param path: path to file
+        @return: hex digest
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._digests:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            self._digests[key] = digest.hexdigest()
+        return self._digests[key]
+
+    def blob_path(self, digest: str):
+        """
+        Get path of blob
+        @param digest: hex digest
+        @return: path
+        """
+        return self.root / "blobs" / digest[:2] / digest
+
+    def add_file(self, path):
+        """
+        Add file to store - files with the same content are stored once
+        @param path: path to file
+        @return: hex digest
+        """
+        digest = self.hash_file(path)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            os.makedirs(blob.parent, exist_ok=True)
+            # Copy to temporary file first - blob appears atomically
+            fd, tmp_path = tempfile.mkstemp(dir=blob.parent)
+            os.close(fd)
+            shutil.copyfile(path, tmp_path)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, blob)
+        return digest
+
+    def link(self, digest: str, dst):
+        """
+        Create file dst referencing blob - hardlink, copy as fallback
+        @param digest: hex digest
+        @param dst: destination path - replaced if it exists
+        """
+        dst = Path(dst)
+        blob = self.blob_path(digest)
+        os.makedirs(dst.parent, exist_ok=True)
+        if dst.exists() or dst.is_symlink():
+            remove_file(dst)
+        # Removing a read-only link on Windows clears the read-only flag of the blob - set it again
+        if os.stat(blob).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+            os.chmod(blob, 0o444)
+        try:
+            os.link(blob, dst)
+        except OSError:
+            shutil.copyfile(blob, dst)
+
+    def stage_file(self, src, dst):
+        """
+        Add file to store and link it to dst
+        @param src: source file
+        @param dst: destination path
+        @return: hex digest
+        """
+        digest = self.add_file(src)
+        self.link(digest, dst)
+        return digest
+
+    def stage_tree(self, src_dir, dst_dir, ignore_dirs=IGNORE_DIRS):
+        """
+        Add all files of directory to store and link them to dst_dir - existing files are replaced
+        @param src_dir: source directory
+        @param dst_dir: destination directory
+        @param ignore_dirs: names of directories that are skipped
+        @return: manifest - dict relative path: hex digest
+        """
+        manifest = {}
+        src_dir = Path(src_dir)
+        for dir, dirs, files in os.walk(src_dir):
+            dirs[:] = [name for name in dirs if name not in ignore_dirs]
+            for file in files:
+                rel_path = (Path(dir) / file).relative_to(src_dir)
+                manifest[rel_path.as_posix()] = self.stage_file(src_dir / rel_path, Path(dst_dir) / rel_path)
+        return manifest
+
+    @staticmethod
+    def write_manifest(manifest: dict, path):
+        """
+        Store manifest as JSON file
+        @param manifest: dict relative path: hex digest
+        @param path: path of manifest file
+        """
+        with open(path, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+    def restore(self, manifest_path, dst_dir):
+        """
+        Create files of manifest in directory
+        @param manifest_path: path of manifest file
+        @param dst_dir: destination directory
+        """
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        for rel_path, digest in manifest.items():
+            self.link(digest, Path(dst_dir) / rel_path)
@@ -3,6 +3,7 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 from distutils.dir_util import copy_tree
+from .artifact_store import ArtifactStore, remove_tree
 
 
 def create_gitignore(dst_dir):
@@ -24,7 +25,18 @@ def create_file(file_path_full, lines):
             f.writelines(lines)
 
 
-def move_model(file_paths, dst_dir):
+def get_artifact_store(file_paths):
+    """
+    Get artifact store configured in fmu srcs object
+    :param file_paths: fmu srcs object - artifact_store: root directory of store, relative to src_root
+    :return: ArtifactStore or None if no store is configured
+    """
+    if not file_paths.artifact_store:
+        return None
+    return ArtifactStore(Path(file_paths.src_root) / file_paths.artifact_store)
+
+
+def move_model(file_paths, dst_dir, store=None):
     """
     Move trained model to destination directory to create FMU
     Copy:
@@ -34,11 +46,14 @@ def move_model(file_paths, dst_dir):
     - additional directories (recursively)
     :param file_paths: fmu srcs object
     :param dst_dir: destination directory (str)
+    :param store: ArtifactStore (optional) - files are stored once in the store and hardlinked instead of copied
+    :return: manifest - dict path relative to dst_dir: hex digest (empty if no store is used)
     """
+    manifest = {}
     src_root = Path(file_paths.src_root)
     dst_root = Path(dst_dir)
-    # Remove old files
-    shutil.rmtree(dst_root, ignore_errors=True)
+    # Remove old files - files staged from an artifact store are read-only
+    remove_tree(dst_root)
     os.makedirs(dst_root, exist_ok=True)
     # Copy additional sources to resources path
     dst_paths = [Path(path) for path in file_paths.src_files.keys()]
@@ -46,17 +61,30 @@ def move_model(file_paths, dst_dir):
         os.makedirs(dst_root / dir_, exist_ok=True)
     # Copy additional sources
     for src_path, dst_path in zip(file_paths.src_files.values(), dst_paths):
-        shutil.copy(str(src_root / src_path), str(dst_root / dst_path))
+        if store is not None:
+            manifest[dst_path.as_posix()] = store.stage_file(src_root / src_path, dst_root / dst_path)
+        else:
+            shutil.copy(str(src_root / src_path), str(dst_root / dst_path))
     # Copy source directories to resources path
     for path in file_paths.src_dirs:
-        copy_tree(str(src_root / path), str(dst_root / os.path.split(path)[-1]))
+        dst_name = os.path.split(path)[-1]
+        if store is not None:
+            manifest.update({f"{dst_name}/{rel_path}": digest for rel_path, digest in
+                             store.stage_tree(src_root / path, dst_root / dst_name).items()})
+        else:
+            copy_tree(str(src_root / path), str(dst_root / dst_name))
     # Copy Pickle model and parameters for each feature
     res_dst = dst_root / file_paths.resource_dst
     resource_root = Path(file_paths.resource_root)
     for src, dst in file_paths.resource_dirs.items():
-        shutil.copytree(resource_root / src, res_dst / dst, dirs_exist_ok=True)
+        if store is not None:
+            manifest.update({(res_dst / dst / rel_path).relative_to(dst_root).as_posix(): digest for rel_path, digest in
+                             store.stage_tree(resource_root / src, res_dst / dst).items()})
+        else:
+            shutil.copytree(resource_root / src, res_dst / dst, dirs_exist_ok=True)
     # Create gitignore in dst dir
     create_gitignore(dst_dir)
+    return manifest
 
 
 def create_file_name_timestamp():
@@ -60,7 +60,10 @@ def train_model_and_create_FMU(exp_dirs: ExperimentDirectoryStructure,
     file_paths.resource_dirs = {os.path.join(f"Models/{list_training_parameters[0].model_name}", feature): feature
                                 for feature in target_features}
     file_paths.resource_root = exp_dirs.get_train_results_path()
-    file_utils.move_model(file_paths, fmu_src_path)
+    store = file_utils.get_artifact_store(file_paths)
+    manifest = file_utils.move_model(file_paths, fmu_src_path, store)
+    if store is not None:
+        store.write_manifest(manifest, os.path.join(exp_dirs.get_FMU_path(), "FMUSources_manifest.json"))
 
     print("Starting FMU Creation")
 
@@ -0,0 +1,51 @@
+import os
+from types import SimpleNamespace
+from Utilities.artifact_store import ArtifactStore, remove_tree
+from Utilities.file_utilities import move_model
+
+
+def create_sources(path):
+    for rel_path, content in [("src/model.py", "a"), ("src/pkg/x.py", "b"), ("src/pkg/y.py", "a"),
+                              ("src/pkg/__pycache__/x.cpython-311.pyc", "c"), ("res/m1/model.pkl", "d")]:
+        os.makedirs(os.path.dirname(path / rel_path), exist_ok=True)
+        with open(path / rel_path, "w") as f:
+            f.write(content)
+
+
+def test_add_and_dedup(tmp_path):
+    create_sources(tmp_path)
+    store = ArtifactStore(tmp_path / "store")
+    digest = store.add_file(tmp_path / "src" / "model.py")
+    assert(store.add_file(tmp_path / "src" / "pkg" / "y.py") == digest)
+    assert(os.listdir(store.blob_path(digest).parent) == [digest])
+    assert(os.stat(store.blob_path(digest)).st_mode & 0o222 == 0)
+
+
+def test_stage_and_restore(tmp_path):
+    create_sources(tmp_path)
+    store = ArtifactStore(tmp_path / "store")
+    manifest = store.stage_tree(tmp_path / "src", tmp_path / "dst")
+    assert(sorted(manifest) == ["model.py", "pkg/x.py", "pkg/y.py"])
+    assert(manifest["model.py"] == manifest["pkg/y.py"])
+    assert(os.path.samefile(tmp_path / "dst" / "model.py", store.blob_path(manifest["model.py"])))
+    store.write_manifest(manifest, tmp_path / "manifest.json")
+    store.restore(tmp_path / "manifest.json", tmp_path / "restored")
+    with open(tmp_path / "restored" / "pkg" / "x.py") as f:
+        assert(f.read() == "b")
+    # Staged files are read-only, but can be replaced and removed
+    store.stage_file(tmp_path / "src" / "pkg" / "x.py", tmp_path / "dst" / "model.py")
+    remove_tree(tmp_path / "dst")
+    assert(not os.path.exists(tmp_path / "dst") and store.blob_path(manifest["model.py"]).exists())
+
+
+def test_move_model_store(tmp_path):
+    create_sources(tmp_path)
+    file_paths = SimpleNamespace(src_root=tmp_path / "src", src_files={"model.py": "model.py"}, src_dirs=["pkg"],
+                                 resource_root=tmp_path / "res", resource_dirs={"m1": "m1"}, resource_dst="models")
+    store = ArtifactStore(tmp_path / "store")
+    for _ in range(2):
+        manifest = move_model(file_paths, tmp_path / "fmu", store)
+    assert(sorted(manifest) == ["model.py", "models/m1/model.pkl", "pkg/x.py", "pkg/y.py"])
+    assert(len(os.listdir(store.root / "blobs")) == 3)
+    assert(move_model(file_paths, tmp_path / "fmu") == {})
+    assert(not os.path.samefile(tmp_path / "fmu" / "model.py", store.blob_path(manifest["model.py"])))
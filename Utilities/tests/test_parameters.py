@@ -0,0 +1,30 @@
+import os
+from Utilities.Parameters import Parameters, Directories
+
+
+def test_parameters_lines(tmp_path):
+    path = str(tmp_path / "dirs.jsonl")
+    Parameters.store_parameters_lines([Directories(root_dir=f"dir{i}") for i in range(5)], path)
+    lines = Parameters.load_parameters_lines(path)
+    assert(len(lines) == 5 and lines[3].root_dir == "dir3" and isinstance(lines[0], Directories))
+    assert([params.root_dir for params in lines[1:3]] == ["dir1", "dir2"])
+    Parameters.append_parameters_line(Directories(root_dir="dir5"), path)
+    assert(Parameters.load_parameters_lines(path)[-1].root_dir == "dir5")
+    # Lines appended without index
+    with open(path, "a") as f:
+        f.write(Directories(root_dir="dir6").to_json() + "\n")
+    assert(len(Parameters.load_parameters_lines(path)) == 7)
+    # Partially written line is not indexed and removed on append
+    with open(path, "a") as f:
+        f.write('{"Type": "Direc')
+    assert(len(Parameters.load_parameters_lines(path)) == 7)
+    Parameters.append_parameters_line(Directories(root_dir="dir7"), path)
+    assert([params.root_dir for params in Parameters.load_parameters_lines(path)][-2:] == ["dir6", "dir7"])
+    # Rewritten file invalidates index
+    with open(path, "w") as f:
+        f.write(Directories(root_dir="new").to_json() + "\n")
+    lines = Parameters.load_parameters_lines(path)
+    assert(len(lines) == 1 and lines[0].root_dir == "new")
+    os.remove(path)
+    Parameters.append_parameters_line(Directories(root_dir="first"), path)
+    assert(Parameters.load_parameters_lines(path)[0].root_dir == "first")